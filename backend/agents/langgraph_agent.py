@@ -115,7 +115,8 @@ class LangGraphAgent:
                     model=self.model,
                     temperature=0.7,
                     streaming=True,
-                    base_url=config.OLLAMA_BASE_URL
+                    base_url=config.OLLAMA_BASE_URL,
+                    keep_alive=config.OLLAMA_KEEP_ALIVE
                 )
             else:
                 raise ValueError(f"Unsupported provider: {self.provider}")
@@ -8,9 +8,18 @@ Agent API 接口
 3. LangGraph方式：使用LangGraph状态图
 """
 import asyncio
+import json
+import os
 from typing import Dict, Any, List, Optional, AsyncGenerator
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from ..agents.chain_agent import ChainAgent
 from ..agents.agent_agent import AgentAgent
 from ..agents.langgraph_agent import LangGraphAgent
@@ -19,6 +28,27 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+TOOLS_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "tools", "tools_config.json")
+
+
+def _read_json_file(path: str) -> Dict[str, Any]:
+    """读取JSON文件，安装了orjson时使用orjson解析"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_file(path: str, data: Dict[str, Any]) -> None:
+    """写入缩进格式的JSON文件，安装了orjson时使用orjson序列化"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 class AgentAPI:
     """Agent API 类 - 统一三种LangChain实现方式"""
@@ -340,7 +370,7 @@ class AgentAPI:
 
                 except Exception as e:
                     # 如果处理某个工具失败，记录错误但继续处理其他工具
-                    print(f"处理工具时出错: {e}")
+                    logger.warning(f"处理工具时出错: {e}")
                     continue
 
         # 更新总数
@@ -368,14 +398,8 @@ class AgentAPI:
 
     def get_tool_config(self, tool_name: str = None) -> Dict[str, Any]:
         """获取工具配置"""
-        import json
-        import os
-
-        config_path = os.path.join(os.path.dirname(__file__), "tools", "tools_config.json")
-
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _read_json_file(TOOLS_CONFIG_PATH)
 
             if tool_name:
                 return config.get("tool_settings", {}).get(tool_name, {})
@@ -388,16 +412,10 @@ class AgentAPI:
 
     def update_tool_config(self, tool_name: str, settings: Dict[str, Any]) -> bool:
         """更新工具配置"""
-        import json
-        import os
-
-        config_path = os.path.join(os.path.dirname(__file__), "tools", "tools_config.json")
-
         try:
             # 读取现有配置
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+            if os.path.exists(TOOLS_CONFIG_PATH):
+                config = _read_json_file(TOOLS_CONFIG_PATH)
             else:
                 config = {
                     "tool_directories": [
@@ -415,8 +433,7 @@ class AgentAPI:
             config["tool_settings"][tool_name] = settings
 
             # 保存配置
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _write_json_file(TOOLS_CONFIG_PATH, config)
 
             logger.info(f"Updated tool config for {tool_name}")
             return True
@@ -425,38 +442,22 @@ class AgentAPI:
             logger.error(f"Failed to update tool config: {e}")
             return False
 
-    def test_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def test_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """测试工具执行"""
-        from .base.tool_base import tool_registry
-        import asyncio
+        from ..tools.tool_service import get_tool_service
 
         try:
-            # 获取工具
-            tool = tool_registry.get_tool(tool_name)
-            if not tool:
-                return {
-                    "success": False,
-                    "error": f"工具 {tool_name} 不存在"
-                }
-
-            # 执行工具
-            def run_tool():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    return loop.run_until_complete(tool.execute(**parameters))
-                finally:
-                    loop.close()
-
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_tool)
-                result = future.result(timeout=30)
+            # 直接在当前事件循环中执行，不再为每次调用创建线程池和新事件循环
+            result = await asyncio.wait_for(
+                get_tool_service().execute_tool(tool_name, **parameters),
+                timeout=30
+            )
+            success = result.get("success", False)
 
             return {
-                "success": result.success,
-                "result": result.result if result.success else None,
-                "error": result.error if not result.success else None,
+                "success": success,
+                "result": result.get("result") if success else None,
+                "error": None if success else (result.get("error") or result.get("result")),
                 "tool_name": tool_name,
                 "parameters": parameters
             }
@@ -782,6 +783,10 @@ class AgentAPI:
             self.current_session_id = None
             self.initialized = False
             
+            # 关闭MCP服务器的HTTP连接池
+            from ..tools.mcp.mcp_loader import get_mcp_loader
+            await get_mcp_loader().close()
+            
             logger.info("Agent API shutdown completed")
             
         except Exception as e:
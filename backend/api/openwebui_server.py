@@ -11,18 +11,11 @@ OpenWebUI兼容的API服务器
 """
 
 import asyncio
-import sys
-import os
 import json
 import uuid
-from pathlib import Path
 from typing import Dict, Any, List, Optional, AsyncGenerator
 from datetime import datetime
 
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
-
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -53,6 +46,8 @@ class ChatCompletionRequest(BaseModel):
     stream: bool = False
     temperature: float = 0.7
     max_tokens: Optional[int] = None
+    # 可选的内联Agent配置 {"mode": ..., "model": ...}，省去单独的配置请求
+    agent_config: Optional[Dict[str, str]] = None
 
 
 class ChatCompletionResponse(BaseModel):
@@ -78,6 +73,7 @@ class OpenWebUIServer:
         self.api = AgentAPI()
         self.initialized = False
         self.sessions: Dict[str, str] = {}  # request_id -> session_id
+        self._unsupported_inline_models: set = set()  # 已告警过的不支持(mode, model)组合
         
         # 支持的模型列表 - 扩展支持工具信息和底层模型配置
         self.models = {
@@ -124,6 +120,28 @@ class OpenWebUIServer:
         }
         return model_mapping.get(model, "chain")
     
+    async def apply_agent_config(self, agent_config: Optional[Dict[str, str]]) -> Optional[str]:
+        """应用请求中内联的Agent配置，仅在模型与当前不同时切换；返回配置中的Agent模式"""
+        if not agent_config:
+            return None
+
+        mode = agent_config.get("mode")
+        model = agent_config.get("model")
+        if not mode or mode not in self.api.agents:
+            return None
+
+        if model and self.api.get_agent_model_info(mode).get("current_model") != model:
+            # 不在支持列表中的模型必然切换失败，直接跳过，避免每个请求都重复尝试并刷警告日志
+            supported_models = self.api.get_supported_models().get("ollama", {}).get("models", [])
+            if model not in supported_models:
+                if (mode, model) not in self._unsupported_inline_models:
+                    self._unsupported_inline_models.add((mode, model))
+                    logger.warning(f"Inline agent config model not supported, skipping switch: {mode} + {model}")
+                return mode
+            if not await self.api.switch_agent_model(mode, model):
+                logger.warning(f"Failed to apply inline agent config: {mode} + {model}")
+        return mode
+
     def get_session_id(self, request_id: str) -> str:
         """获取或创建会话ID"""
         if request_id not in self.sessions:
@@ -135,8 +153,8 @@ class OpenWebUIServer:
         if not self.initialized:
             await self.initialize()
         
-        # 切换到对应的Agent
-        agent_type = self.get_agent_type_from_model(request.model)
+        # 切换到对应的Agent（内联配置优先）
+        agent_type = await self.apply_agent_config(request.agent_config) or self.get_agent_type_from_model(request.model)
         self.api.set_current_agent(agent_type)
         
         # 获取会话ID
@@ -214,8 +232,8 @@ class OpenWebUIServer:
         if not self.initialized:
             await self.initialize()
         
-        # 切换到对应的Agent
-        agent_type = self.get_agent_type_from_model(request.model)
+        # 切换到对应的Agent（内联配置优先）
+        agent_type = await self.apply_agent_config(request.agent_config) or self.get_agent_type_from_model(request.model)
         self.api.set_current_agent(agent_type)
         
         # 获取会话ID
@@ -373,6 +391,12 @@ async def startup_event():
     await server.initialize()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """关闭事件"""
+    await server.api.shutdown()
+
+
 @app.get("/v1/models")
 async def list_models():
     """列出可用模型 - Agent模式和模型分离的组合模型"""
@@ -402,7 +426,7 @@ async def list_models():
                             "parameters": tool_info.get("parameters", {})
                         })
             except Exception as e:
-                print(f"获取工具信息失败: {e}")
+                logger.error(f"获取工具信息失败: {e}")
 
         for model_id, model_config in server.models.items():
             model_data = {
@@ -47,6 +47,8 @@ class Config:
 
     # Ollama配置
     OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    # 模型在Ollama中的驻留时间；模型保持加载时，相同的提示词前缀（系统提示等）可复用已计算的KV缓存
+    OLLAMA_KEEP_ALIVE: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
 
     # 向量数据库配置
     CHROMA_PERSIST_DIRECTORY: str = os.getenv("CHROMA_PERSIST_DIRECTORY", "./chroma_db")
@@ -229,7 +231,9 @@ class Config:
             }
         },
         "timeout": 30,
-        "retry_attempts": 3
+        "retry_attempts": 3,
+        "cache_ttl": 60,  # 文件系统MCP工具结果缓存时间（秒），0表示不缓存
+        "cache_size": 256  # 文件系统MCP工具结果缓存的最大条目数
     }
 
     # ==================== 配置管理方法 ====================
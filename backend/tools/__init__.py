@@ -13,18 +13,37 @@
 3. 自定义工具：用户在custom/目录下添加的工具
 4. MCP工具：基于Model Context Protocol的工具
 """
-from .builtin import get_example_tools, get_basic_tools, get_advanced_tools
-# ToolManager已合并到ToolService中
-from .tool_service import ToolService, get_tool_service, initialize_tool_service
-from .tool_loader import UnifiedToolLoader, get_tool_loader
+import importlib
 
-__all__ = [
+# 公共名称 -> 所在子模块，首次访问时才导入（PEP 562），
+# 避免导入backend.tools.xxx子模块时连带加载全部工具
+_LAZY_EXPORTS = {
     # 内置工具
-    "get_example_tools", "get_basic_tools", "get_advanced_tools",
+    "get_example_tools": ".builtin",
+    "get_basic_tools": ".builtin",
+    "get_advanced_tools": ".builtin",
 
-    # 工具管理
-    "ToolService", "get_tool_service", "initialize_tool_service",
+    # 工具管理（ToolManager已合并到ToolService中）
+    "ToolService": ".tool_service",
+    "get_tool_service": ".tool_service",
+    "initialize_tool_service": ".tool_service",
 
     # 工具加载器
-    "UnifiedToolLoader", "get_tool_loader"
-]
+    "UnifiedToolLoader": ".tool_loader",
+    "get_tool_loader": ".tool_loader",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,12 +5,50 @@ OpenWebUI工具导出器
 
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from .universal_tool_adapter import universal_adapter
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 导出工具的结果缓存时间（秒）：只读且结果短期稳定的工具才缓存，未列出的工具不缓存
+RESULT_CACHE_TTL_SECONDS = {
+    "get_current_time": 1,
+    "list_files": 2,
+    "read_file": 30,
+    "web_search": 300,
+    "weather_query": 600,
+    "wikipedia_search": 86400,
+}
+
+
+def _to_python_literal(value: Any, level: int = 0) -> str:
+    """
+    将JSON参数定义渲染为Python字面量（格式与json.dumps(indent=4)一致）
+
+    json.dumps会输出true/false/null，写入生成的Python文件后在导入时触发NameError
+    """
+    if isinstance(value, bool):
+        return "True" if value else "False"
+    if value is None:
+        return "None"
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        inner = " " * (4 * (level + 1))
+        items = (
+            f"{inner}{json.dumps(key, ensure_ascii=False)}: {_to_python_literal(item, level + 1)}"
+            for key, item in value.items()
+        )
+        return "{\n" + ",\n".join(items) + "\n" + " " * (4 * level) + "}"
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return "[]"
+        inner = " " * (4 * (level + 1))
+        items = (f"{inner}{_to_python_literal(item, level + 1)}" for item in value)
+        return "[\n" + ",\n".join(items) + "\n" + " " * (4 * level) + "]"
+    return json.dumps(value, ensure_ascii=False)
+
 
 class OpenWebUIExporter:
     """OpenWebUI工具导出器"""
@@ -35,31 +73,36 @@ class OpenWebUIExporter:
         except Exception as e:
             logger.error(f"Failed to create export directory: {e}")
     
-    def export_all_tools(self) -> bool:
-        """导出所有工具为OpenWebUI格式"""
+    def export_all_tools(self) -> Optional[List[str]]:
+        """导出所有工具为OpenWebUI格式，返回写入的文件路径列表，失败时返回None"""
         try:
             openwebui_tools = universal_adapter.get_openwebui_tools()
             
             if not openwebui_tools:
                 logger.warning("No tools to export")
-                return True
+                return []
             
             # 为每个工具创建单独的文件
+            written = []
             for tool_name, tool_config in openwebui_tools.items():
-                self._export_single_tool(tool_name, tool_config)
+                file_path = self._export_single_tool(tool_name, tool_config)
+                if file_path:
+                    written.append(file_path)
             
             # 创建工具索引文件
-            self._create_tools_index(openwebui_tools)
+            index_path = self._create_tools_index(openwebui_tools)
+            if index_path:
+                written.append(index_path)
             
             logger.info(f"Exported {len(openwebui_tools)} tools to OpenWebUI format")
-            return True
+            return written
             
         except Exception as e:
             logger.error(f"Failed to export tools: {e}")
-            return False
+            return None
     
-    def _export_single_tool(self, tool_name: str, tool_config: Dict[str, Any]):
-        """导出单个工具"""
+    def _export_single_tool(self, tool_name: str, tool_config: Dict[str, Any]) -> Optional[str]:
+        """导出单个工具，返回写入的文件路径"""
         try:
             # 生成OpenWebUI工具文件内容
             tool_content = self._generate_tool_file_content(tool_name, tool_config)
@@ -70,15 +113,18 @@ class OpenWebUIExporter:
                 f.write(tool_content)
             
             logger.debug(f"Exported tool: {tool_name} -> {file_path}")
+            return file_path
             
         except Exception as e:
             logger.error(f"Failed to export tool {tool_name}: {e}")
+            return None
     
     def _generate_tool_file_content(self, tool_name: str, tool_config: Dict[str, Any]) -> str:
         """生成OpenWebUI工具文件内容"""
         description = tool_config.get("description", "")
         parameters = tool_config.get("parameters", {})
         citation = tool_config.get("citation", True)
+        cache_ttl = RESULT_CACHE_TTL_SECONDS.get(tool_name, 0)
         
         # 生成参数文档
         param_docs = self._generate_parameter_docs(parameters)
@@ -90,40 +136,115 @@ OpenWebUI工具: {tool_name}
 自动生成的工具文件 - 请勿手动修改
 """
 
+from collections import OrderedDict
 from typing import Any, Dict
-import json
+import asyncio
+import os
+import time
+import httpx
+
+# OpenWebUI将每个工具文件单独保存并执行，工具文件之间无法导入共享模块，
+# 以下辅助代码由导出器生成到每个工具文件中，请保持精简
+
+_BACKEND_URL = "http://langchain-backend:8000"
+_EXECUTE_URL = f"{{_BACKEND_URL}}/v1/tools/execute"
+
+# 模块级异步HTTP客户端：复用到后端的长连接，多个工具调用可在同一事件循环中并发执行
+_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    transport=httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        retries=2
+    )
+)
+
+# 工具结果缓存：参数 -> (过期时间, 结果)，按LRU淘汰；CACHE_TTL_SECONDS为0表示不缓存
+CACHE_TTL_SECONDS = {cache_ttl}
+CACHE_MAX_ENTRIES = 1024
+_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+
+# 与LangChain后端同进程部署时直接调用本地工具，省去HTTP往返
+try:
+    from backend.tools.adapters.universal_tool_adapter import universal_adapter as _local_adapter
+except ImportError:
+    _local_adapter = None
+
+
+async def _execute_tool(tool_name: str, parameters: Dict[str, Any]) -> str:
+    """执行工具：依次尝试结果缓存、本地调用和LangChain后端API"""
+    try:
+        cache_key = repr(tuple(parameters.values()))
+        entry = _CACHE.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            _CACHE.move_to_end(cache_key)
+            return entry[1]
+
+        local_tool = _local_adapter.get_langchain_tool(tool_name) if _local_adapter is not None else None
+        if local_tool is not None:
+            result = str(await local_tool.arun(parameters))
+        else:
+            payload = {{"tool_name": tool_name, "parameters": parameters}}
+            response = await _CLIENT.post(_EXECUTE_URL, json=payload)
+            if response.status_code != 200:
+                return f"工具执行失败: {{response.status_code}}"
+            # 后端原样返回工具结果，可能是字典或列表，统一转为文本
+            result = str(response.json().get("result", "执行成功"))
+
+        # 失败提示不缓存
+        if CACHE_TTL_SECONDS > 0 and not result.startswith("❌"):
+            _CACHE[cache_key] = (time.monotonic() + CACHE_TTL_SECONDS, result)
+            _CACHE.move_to_end(cache_key)
+            if len(_CACHE) > CACHE_MAX_ENTRIES:
+                _CACHE.popitem(last=False)
+        return result
+
+    except Exception as e:
+        return f"工具执行错误: {{str(e)}}"
+
+
+async def _prewarm():
+    """请求后端健康检查接口，使到后端的连接提前进入连接池"""
+    try:
+        await _CLIENT.get(f"{{_BACKEND_URL}}/health", timeout=2)
+    except Exception:
+        pass
+
+
+# 在加载工具的事件循环上后台预热连接，首次调用无需等待DNS解析和TCP握手；
+# 同进程部署、没有运行中的事件循环或设置了NO_PREWARM时跳过
+_PREWARM_TASK = None
+if _local_adapter is None and not os.environ.get("NO_PREWARM"):
+    try:
+        _PREWARM_TASK = asyncio.get_running_loop().create_task(_prewarm())
+    except RuntimeError:
+        pass
 
 
 class Tools:
+    __slots__ = ("citation",)
+
     def __init__(self):
-        self.citation = {str(citation).lower()}
+        self.citation = {bool(citation)}
 
-    def {tool_name}(self{param_docs["signature"]}) -> str:
+    async def {tool_name}(self{param_docs["signature"]}) -> str:
         """
         {description}
         
 {param_docs["docstring"]}
         """
-        try:
-            # 调用LangChain后端API
-            import requests
-            
-            url = "http://langchain-backend:8000/v1/tools/execute"
-            payload = {{
-                "tool_name": "{tool_name}",
-                "parameters": {{{param_docs["payload"]}}}
-            }}
-            
-            response = requests.post(url, json=payload, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("result", "执行成功")
-            else:
-                return f"工具执行失败: {{response.status_code}}"
-                
-        except Exception as e:
-            return f"工具执行错误: {{str(e)}}"
+        return await _execute_tool("{tool_name}", {{{param_docs["payload"]}}})
+
+
+# 工具实例和定义在模块加载时创建一次
+_TOOLS = Tools()
+TOOLS_DEF = {{
+    "{tool_name}": {{
+        "callable": _TOOLS.{tool_name},
+        "citation": _TOOLS.citation,
+        "description": "{description}",
+        "parameters": {_to_python_literal(parameters, 2)}
+    }}
+}}
 
 
 # OpenWebUI工具规范
@@ -131,20 +252,14 @@ class {tool_name.title()}Tool:
     """
     OpenWebUI {tool_name} 工具
     """
+    __slots__ = ("tools",)
     
     def __init__(self):
-        self.tools = Tools()
+        self.tools = _TOOLS
     
     def get_tools(self):
         """返回工具定义"""
-        return {{
-            "{tool_name}": {{
-                "callable": self.tools.{tool_name},
-                "citation": self.tools.citation,
-                "description": "{description}",
-                "parameters": {json.dumps(parameters, indent=16, ensure_ascii=False)}
-            }}
-        }}
+        return TOOLS_DEF
 
 
 # 实例化工具
@@ -201,8 +316,8 @@ tools = {tool_name}_tool.get_tools()
             "payload": ", ".join(payload_parts)
         }
     
-    def _create_tools_index(self, tools: Dict[str, Any]):
-        """创建工具索引文件"""
+    def _create_tools_index(self, tools: Dict[str, Any]) -> Optional[str]:
+        """创建工具索引文件，返回写入的文件路径"""
         try:
             index_content = f'''"""
 OpenWebUI工具索引
@@ -212,13 +327,18 @@ OpenWebUI工具索引
 {chr(10).join(f"- {name}: {config.get('description', '')}" for name, config in tools.items())}
 """
 
-# 工具列表
-AVAILABLE_TOOLS = {json.dumps(list(tools.keys()), indent=4, ensure_ascii=False)}
-
 # 工具描述
 TOOL_DESCRIPTIONS = {{
 {chr(10).join(f'    "{name}": "{config.get("description", "")}",' for name, config in tools.items())}
 }}
+
+# 工具列表（由TOOL_DESCRIPTIONS派生）
+AVAILABLE_TOOLS = tuple(TOOL_DESCRIPTIONS)
+
+
+def has_tool(name: str) -> bool:
+    """检查工具是否存在"""
+    return name in TOOL_DESCRIPTIONS
 '''
             
             index_path = os.path.join(self.export_path, "__init__.py")
@@ -226,15 +346,17 @@ TOOL_DESCRIPTIONS = {{
                 f.write(index_content)
             
             logger.debug(f"Created tools index: {index_path}")
+            return index_path
             
         except Exception as e:
             logger.error(f"Failed to create tools index: {e}")
+            return None
 
 
 # 全局导出器实例
 openwebui_exporter = OpenWebUIExporter()
 
 
-def export_tools_to_openwebui() -> bool:
-    """导出工具到OpenWebUI"""
+def export_tools_to_openwebui() -> Optional[List[str]]:
+    """导出工具到OpenWebUI，返回写入的文件路径列表，失败时返回None"""
     return openwebui_exporter.export_all_tools()
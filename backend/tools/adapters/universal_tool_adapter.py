@@ -6,6 +6,10 @@
 import inspect
 import json
 from typing import Any, Dict, List, Callable, Optional, Union
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel, Field
 from langchain_core.tools import BaseTool, tool
 from langchain_core.tools.structured import StructuredTool
@@ -13,6 +17,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 工具共享的HTTP会话：同一外部服务的请求复用长连接，避免每次调用重新握手
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
 
 class UniversalToolDefinition(BaseModel):
     """统一工具定义格式"""
@@ -50,6 +62,28 @@ class UniversalToolAdapter:
             return_direct: 是否直接返回结果
             citation: 是否需要引用
         """
+        self._register(name, function, description, parameters, return_direct, citation)
+        logger.info(f"Registered universal tool: {name}")
+
+    def register_many(self, specs: List[Dict[str, Any]]) -> None:
+        """
+        批量注册统一工具
+
+        Args:
+            specs: 工具定义列表，每项的键与register_tool的参数相同
+        """
+        for spec in specs:
+            self._register(**spec)
+        logger.info(f"Registered {len(specs)} universal tools: {', '.join(spec['name'] for spec in specs)}")
+
+    def _register(self,
+                  name: str,
+                  function: Callable,
+                  description: str,
+                  parameters: Optional[Dict[str, Any]] = None,
+                  return_direct: bool = False,
+                  citation: bool = True) -> None:
+        """注册单个工具，不输出日志"""
         # 如果没有提供参数定义，尝试从函数签名自动生成
         if parameters is None:
             parameters = self._extract_parameters_from_function(function)
@@ -68,8 +102,6 @@ class UniversalToolAdapter:
         # 自动生成LangChain和OpenWebUI格式
         self._generate_langchain_tool(tool_def)
         self._generate_openwebui_tool(tool_def)
-        
-        logger.info(f"Registered universal tool: {name}")
     
     def _extract_parameters_from_function(self, func: Callable) -> Dict[str, Any]:
         """从函数签名自动提取参数定义"""
@@ -219,6 +251,10 @@ class UniversalToolAdapter:
         """获取所有LangChain格式的工具"""
         return list(self.langchain_tools.values())
     
+    def get_langchain_tool(self, tool_name: str) -> Optional[BaseTool]:
+        """按名称获取LangChain格式的工具"""
+        return self.langchain_tools.get(tool_name)
+    
     def get_openwebui_tools(self) -> Dict[str, Dict]:
         """获取所有OpenWebUI格式的工具"""
         return self.openwebui_tools.copy()
@@ -242,12 +278,9 @@ class UniversalToolAdapter:
     
     def remove_tool(self, tool_name: str) -> bool:
         """移除工具"""
-        if tool_name in self.tools_registry:
-            del self.tools_registry[tool_name]
-            if tool_name in self.langchain_tools:
-                del self.langchain_tools[tool_name]
-            if tool_name in self.openwebui_tools:
-                del self.openwebui_tools[tool_name]
+        if self.tools_registry.pop(tool_name, None) is not None:
+            self.langchain_tools.pop(tool_name, None)
+            self.openwebui_tools.pop(tool_name, None)
             logger.info(f"Removed tool: {tool_name}")
             return True
         return False
@@ -416,12 +449,9 @@ class ToolAutoDiscovery:
             Returns:
                 搜索结果
             """
-            import requests
-            from urllib.parse import quote
-
             try:
                 url = f"https://api.duckduckgo.com/?q={quote(query)}&format=json&no_html=1&skip_disambig=1"
-                response = requests.get(url, timeout=10)
+                response = http_session.get(url, timeout=10)
                 response.raise_for_status()
 
                 data = response.json()
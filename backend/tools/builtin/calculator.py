@@ -8,6 +8,9 @@ import operator
 from typing import Any, Dict
 from langchain_core.tools import tool
 from backend.tools.adapters.universal_tool_adapter import universal_adapter
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 @tool
@@ -74,7 +77,7 @@ def register_calculator_tool():
             }
         )
     except Exception as e:
-        print(f"Failed to register calculator tool: {e}")
+        logger.error(f"Failed to register calculator tool: {e}")
 
 
 # 自动注册
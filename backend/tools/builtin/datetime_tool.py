@@ -8,6 +8,9 @@ import pytz
 from typing import Optional
 from langchain_core.tools import tool
 from backend.tools.adapters.universal_tool_adapter import universal_adapter
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 @tool
@@ -77,46 +80,47 @@ def register_datetime_tools():
     """注册时间工具到统一适配器"""
     try:
         # 注册当前时间工具
-        universal_adapter.register_tool(
-            name="get_current_time",
-            function=get_current_time.func,
-            description="获取当前日期和时间，支持不同时区",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "timezone_name": {
-                        "type": "string",
-                        "description": "时区名称，例如 'Asia/Shanghai', 'UTC', 'America/New_York'",
-                        "default": "Asia/Shanghai"
-                    }
-                },
-                "required": []
-            }
-        )
-        
-        # 注册时间戳格式化工具
-        universal_adapter.register_tool(
-            name="format_timestamp",
-            function=format_timestamp.func,
-            description="将时间戳转换为可读的时间格式",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "timestamp": {
-                        "type": "string",
-                        "description": "Unix时间戳（秒）"
+        universal_adapter.register_many([
+            {
+                "name": "get_current_time",
+                "function": get_current_time.func,
+                "description": "获取当前日期和时间，支持不同时区",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "timezone_name": {
+                            "type": "string",
+                            "description": "时区名称，例如 'Asia/Shanghai', 'UTC', 'America/New_York'",
+                            "default": "Asia/Shanghai"
+                        }
+                    },
+                    "required": []
+                }
+            },
+            # 注册时间戳格式化工具
+            {
+                "name": "format_timestamp",
+                "function": format_timestamp.func,
+                "description": "将时间戳转换为可读的时间格式",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "timestamp": {
+                            "type": "string",
+                            "description": "Unix时间戳（秒）"
+                        },
+                        "format_str": {
+                            "type": "string",
+                            "description": "时间格式字符串，例如 '%Y-%m-%d %H:%M:%S'",
+                            "default": "%Y-%m-%d %H:%M:%S"
+                        }
                     },
-                    "format_str": {
-                        "type": "string",
-                        "description": "时间格式字符串，例如 '%Y-%m-%d %H:%M:%S'",
-                        "default": "%Y-%m-%d %H:%M:%S"
-                    }
-                },
-                "required": ["timestamp"]
+                    "required": ["timestamp"]
+                }
             }
-        )
+        ])
     except Exception as e:
-        print(f"Failed to register datetime tools: {e}")
+        logger.error(f"Failed to register datetime tools: {e}")
 
 
 # 自动注册
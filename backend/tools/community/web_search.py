@@ -3,14 +3,17 @@
 基于DuckDuckGo的免费网络搜索工具
 """
 
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import quote
 from langchain_core.tools import BaseTool
-from backend.tools.adapters.universal_tool_adapter import universal_adapter
+from backend.tools.adapters.universal_tool_adapter import universal_adapter, http_session
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
 def create_duckduckgo_tool() -> Optional[BaseTool]:
     """创建DuckDuckGo搜索工具"""
     try:
@@ -48,13 +51,10 @@ def web_search(query: str, num_results: int = 5) -> str:
 def _fallback_search(query: str, num_results: int = 5) -> str:
     """降级搜索方案"""
     try:
-        import requests
-        from urllib.parse import quote
-        
         # 使用DuckDuckGo即时搜索API
         url = f"https://api.duckduckgo.com/?q={quote(query)}&format=json&no_html=1&skip_disambig=1"
         
-        response = requests.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
         response.raise_for_status()
         
         data = response.json()
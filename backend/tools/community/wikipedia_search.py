@@ -3,6 +3,7 @@
 基于LangChain Community的Wikipedia查询工具
 """
 
+from functools import lru_cache
 from typing import Optional
 from langchain_core.tools import BaseTool
 from backend.tools.adapters.universal_tool_adapter import universal_adapter
@@ -11,6 +12,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
 def create_wikipedia_tool() -> Optional[BaseTool]:
     """创建Wikipedia搜索工具"""
     try:
@@ -187,70 +187,70 @@ def register_file_tools():
     """注册文件操作工具到统一适配器"""
     try:
         # 注册读取文件工具
-        universal_adapter.register_tool(
-            name="read_file",
-            function=read_file.func,
-            description="读取文件内容（限制在workspace目录内）",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "文件路径，相对于workspace目录"
+        universal_adapter.register_many([
+            {
+                "name": "read_file",
+                "function": read_file.func,
+                "description": "读取文件内容（限制在workspace目录内）",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "file_path": {
+                            "type": "string",
+                            "description": "文件路径，相对于workspace目录"
+                        },
+                        "encoding": {
+                            "type": "string",
+                            "description": "文件编码",
+                            "default": "utf-8"
+                        }
                     },
-                    "encoding": {
-                        "type": "string",
-                        "description": "文件编码",
-                        "default": "utf-8"
-                    }
-                },
-                "required": ["file_path"]
-            }
-        )
-        
-        # 注册写入文件工具
-        universal_adapter.register_tool(
-            name="write_file",
-            function=write_file.func,
-            description="写入文件内容（限制在workspace目录内）",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "文件路径，相对于workspace目录"
+                    "required": ["file_path"]
+                }
+            },
+            # 注册写入文件工具
+            {
+                "name": "write_file",
+                "function": write_file.func,
+                "description": "写入文件内容（限制在workspace目录内）",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "file_path": {
+                            "type": "string",
+                            "description": "文件路径，相对于workspace目录"
+                        },
+                        "content": {
+                            "type": "string",
+                            "description": "要写入的内容"
+                        },
+                        "encoding": {
+                            "type": "string",
+                            "description": "文件编码",
+                            "default": "utf-8"
+                        }
                     },
-                    "content": {
-                        "type": "string",
-                        "description": "要写入的内容"
+                    "required": ["file_path", "content"]
+                }
+            },
+            # 注册列出文件工具
+            {
+                "name": "list_files",
+                "function": list_files.func,
+                "description": "列出目录中的文件和子目录。⚠️ 只能访问相对路径，不能访问绝对路径（如C:\\或/home/）。工作目录：./workspace",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "directory": {
+                            "type": "string",
+                            "description": "目录路径，必须是相对路径（相对于workspace目录）。例如：'.'（当前目录）、'data'（子目录）、'files/docs'（嵌套目录）。不能使用绝对路径。",
+                            "default": "."
+                        }
                     },
-                    "encoding": {
-                        "type": "string",
-                        "description": "文件编码",
-                        "default": "utf-8"
-                    }
-                },
-                "required": ["file_path", "content"]
-            }
-        )
-        
-        # 注册列出文件工具
-        universal_adapter.register_tool(
-            name="list_files",
-            function=list_files.func,
-            description="列出目录中的文件和子目录。⚠️ 只能访问相对路径，不能访问绝对路径（如C:\\或/home/）。工作目录：./workspace",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "directory": {
-                        "type": "string",
-                        "description": "目录路径，必须是相对路径（相对于workspace目录）。例如：'.'（当前目录）、'data'（子目录）、'files/docs'（嵌套目录）。不能使用绝对路径。",
-                        "default": "."
-                    }
-                },
-                "required": []
+                    "required": []
+                }
             }
-        )
+        ])
     except Exception as e:
         logger.error(f"Failed to register file tools: {e}")
 
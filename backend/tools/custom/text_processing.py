@@ -5,6 +5,7 @@
 
 import re
 import json
+from collections import Counter
 from typing import Dict, List
 from langchain_core.tools import tool
 from backend.tools.adapters.universal_tool_adapter import universal_adapter
@@ -12,6 +13,57 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# ASCII下str.isspace()为真的全部字符
+_ASCII_SPACES = " \t\n\r\v\f\x1c\x1d\x1e\x1f"
+_ASCII_DIGITS = b"0123456789"
+# bytes.translate删除表：删除所有非字母字节后剩余长度即字母数
+_ASCII_NON_LETTERS = bytes(b for b in range(128) if not chr(b).isalpha())
+
+# 预编译正则，避免每次调用都走re模块的模式缓存查找
+_RE_WORD = re.compile(r'\b\w+\b')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_SENTENCE_END = re.compile(r'[.!?]+')
+
+# 信息提取：类型 -> (预编译正则, 结果标题, 未找到提示)
+_EXTRACT_PATTERNS = {
+    "emails": (
+        re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        "📧 邮箱地址",
+        "未找到邮箱地址",
+    ),
+    "urls": (
+        re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'),
+        "🔗 网址",
+        "未找到网址",
+    ),
+    "phones": (
+        re.compile(r'(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'),
+        "📞 电话号码",
+        "未找到电话号码",
+    ),
+    "numbers": (
+        re.compile(r'\b\d+(?:\.\d+)?\b'),
+        "🔢 数字",
+        "未找到数字",
+    ),
+}
+
+
+def _count_char_types(text: str):
+    """统计字母、数字、空白字符数量，ASCII文本走C层批量计数"""
+    if text.isascii():
+        data = text.encode("ascii")
+        letters = len(data.translate(None, _ASCII_NON_LETTERS))
+        digits = sum(data.count(d) for d in _ASCII_DIGITS)
+        spaces = sum(text.count(c) for c in _ASCII_SPACES)
+        return letters, digits, spaces
+
+    # 含Unicode字符时逐字符判断，保证与str方法语义一致
+    letters = sum(1 for c in text if c.isalpha())
+    digits = sum(1 for c in text if c.isdigit())
+    spaces = sum(1 for c in text if c.isspace())
+    return letters, digits, spaces
+
 
 @tool
 def text_statistics(text: str) -> str:
@@ -31,18 +83,13 @@ def text_statistics(text: str) -> str:
         line_count = len(text.split('\n'))
         
         # 字符类型统计
-        letters = sum(1 for c in text if c.isalpha())
-        digits = sum(1 for c in text if c.isdigit())
-        spaces = sum(1 for c in text if c.isspace())
+        letters, digits, spaces = _count_char_types(text)
         punctuation = char_count - letters - digits - spaces
         
         # 词频统计（前5个）
-        words = re.findall(r'\b\w+\b', text.lower())
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        
-        top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
+        # 逐个匹配计数，不生成完整的单词列表
+        word_freq = Counter(m.group() for m in _RE_WORD.finditer(text.lower()))
+        top_words = word_freq.most_common(5)
         
         result = f"""📊 文本统计分析:
         
@@ -83,7 +130,7 @@ def text_formatter(text: str, format_type: str = "clean") -> str:
     try:
         if format_type == "clean":
             # 清理多余空格和换行
-            cleaned = re.sub(r'\s+', ' ', text.strip())
+            cleaned = _RE_WHITESPACE.sub(' ', text.strip())
             return f"🧹 清理后的文本:\n{cleaned}"
         
         elif format_type == "title":
@@ -93,7 +140,7 @@ def text_formatter(text: str, format_type: str = "clean") -> str:
         
         elif format_type == "sentence":
             # 句子格式化
-            sentences = re.split(r'[.!?]+', text)
+            sentences = _RE_SENTENCE_END.split(text)
             formatted = []
             for sentence in sentences:
                 sentence = sentence.strip()
@@ -146,24 +193,15 @@ def extract_information(text: str, info_type: str = "emails") -> str:
         提取的信息
     """
     try:
-        if info_type == "emails":
-            emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-            return f"📧 邮箱地址 ({len(emails)}个):\n" + '\n'.join(f"- {email}" for email in emails) if emails else "未找到邮箱地址"
-        
-        elif info_type == "urls":
-            urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', text)
-            return f"🔗 网址 ({len(urls)}个):\n" + '\n'.join(f"- {url}" for url in urls) if urls else "未找到网址"
-        
-        elif info_type == "phones":
-            phones = re.findall(r'(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', text)
-            return f"📞 电话号码 ({len(phones)}个):\n" + '\n'.join(f"- {phone}" for phone in phones) if phones else "未找到电话号码"
-        
-        elif info_type == "numbers":
-            numbers = re.findall(r'\b\d+(?:\.\d+)?\b', text)
-            return f"🔢 数字 ({len(numbers)}个):\n" + '\n'.join(f"- {num}" for num in numbers) if numbers else "未找到数字"
-        
-        else:
+        entry = _EXTRACT_PATTERNS.get(info_type)
+        if entry is None:
             return f"❌ 未知信息类型: {info_type}，支持: emails, urls, phones, numbers"
+
+        pattern, label, not_found = entry
+        items = pattern.findall(text)
+        if not items:
+            return not_found
+        return f"{label} ({len(items)}个):\n" + '\n'.join(f"- {item}" for item in items)
         
     except Exception as e:
         return f"❌ 信息提取失败: {str(e)}"
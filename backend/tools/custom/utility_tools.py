@@ -8,6 +8,7 @@ import string
 import hashlib
 import base64
 import uuid
+from urllib.parse import quote as _url_quote, unquote as _url_unquote
 from datetime import datetime, timedelta
 from langchain_core.tools import tool
 from backend.tools.adapters.universal_tool_adapter import universal_adapter
@@ -15,6 +16,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_b64encode = base64.b64encode
+_b64decode = base64.b64decode
+
 
 @tool
 def generate_password(length: int = 12, include_symbols: bool = True) -> str:
@@ -66,6 +70,15 @@ def generate_password(length: int = 12, include_symbols: bool = True) -> str:
         return f"❌ 密码生成失败: {str(e)}"
 
 
+# 哈希算法分发表
+_HASH_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+}
+
+
 @tool
 def hash_text(text: str, algorithm: str = "md5") -> str:
     """
@@ -79,20 +92,11 @@ def hash_text(text: str, algorithm: str = "md5") -> str:
         哈希值
     """
     try:
-        text_bytes = text.encode('utf-8')
-        
-        if algorithm == "md5":
-            hash_obj = hashlib.md5(text_bytes)
-        elif algorithm == "sha1":
-            hash_obj = hashlib.sha1(text_bytes)
-        elif algorithm == "sha256":
-            hash_obj = hashlib.sha256(text_bytes)
-        elif algorithm == "sha512":
-            hash_obj = hashlib.sha512(text_bytes)
-        else:
+        hash_func = _HASH_ALGORITHMS.get(algorithm)
+        if hash_func is None:
             return f"❌ 不支持的算法: {algorithm}，支持: md5, sha1, sha256, sha512"
         
-        hash_value = hash_obj.hexdigest()
+        hash_value = hash_func(text.encode('utf-8')).hexdigest()
         
         return f"🔒 {algorithm.upper()}哈希值:\n{hash_value}\n\n原文: {text[:50]}{'...' if len(text) > 50 else ''}"
         
@@ -100,6 +104,38 @@ def hash_text(text: str, algorithm: str = "md5") -> str:
         return f"❌ 哈希计算失败: {str(e)}"
 
 
+def _base64_encode(text: str) -> str:
+    encoded = _b64encode(text.encode('utf-8')).decode('utf-8')
+    return f"📝 Base64编码结果:\n{encoded}"
+
+
+def _base64_decode(text: str) -> str:
+    try:
+        decoded = _b64decode(text).decode('utf-8')
+        return f"📖 Base64解码结果:\n{decoded}"
+    except Exception:
+        return "❌ Base64解码失败，请检查输入格式"
+
+
+def _url_encode(text: str) -> str:
+    encoded = _url_quote(text)
+    return f"🔗 URL编码结果:\n{encoded}"
+
+
+def _url_decode(text: str) -> str:
+    decoded = _url_unquote(text)
+    return f"🔓 URL解码结果:\n{decoded}"
+
+
+# 编码/解码操作分发表
+_ENCODE_OPERATIONS = {
+    "base64_encode": _base64_encode,
+    "base64_decode": _base64_decode,
+    "url_encode": _url_encode,
+    "url_decode": _url_decode,
+}
+
+
 @tool
 def encode_decode_text(text: str, operation: str = "base64_encode") -> str:
     """
@@ -113,30 +149,12 @@ def encode_decode_text(text: str, operation: str = "base64_encode") -> str:
         处理结果
     """
     try:
-        if operation == "base64_encode":
-            encoded = base64.b64encode(text.encode('utf-8')).decode('utf-8')
-            return f"📝 Base64编码结果:\n{encoded}"
-        
-        elif operation == "base64_decode":
-            try:
-                decoded = base64.b64decode(text).decode('utf-8')
-                return f"📖 Base64解码结果:\n{decoded}"
-            except Exception:
-                return "❌ Base64解码失败，请检查输入格式"
-        
-        elif operation == "url_encode":
-            import urllib.parse
-            encoded = urllib.parse.quote(text)
-            return f"🔗 URL编码结果:\n{encoded}"
-        
-        elif operation == "url_decode":
-            import urllib.parse
-            decoded = urllib.parse.unquote(text)
-            return f"🔓 URL解码结果:\n{decoded}"
-        
-        else:
+        handler = _ENCODE_OPERATIONS.get(operation)
+        if handler is None:
             return f"❌ 未知操作: {operation}，支持: base64_encode, base64_decode, url_encode, url_decode"
         
+        return handler(text)
+        
     except Exception as e:
         return f"❌ 编码/解码失败: {str(e)}"
 
@@ -208,51 +226,52 @@ def register_utility_tools():
     """注册实用工具到统一适配器"""
     try:
         # 注册UUID生成工具
-        universal_adapter.register_tool(
-            name="generate_uuid",
-            function=generate_uuid,
-            description="生成UUID（通用唯一标识符）",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "version": {
-                        "type": "integer",
-                        "description": "UUID版本",
-                        "enum": [1, 4],
-                        "default": 4
-                    }
-                },
-                "required": []
-            }
-        )
-        
-        # 注册日期计算工具
-        universal_adapter.register_tool(
-            name="date_calculator",
-            function=date_calculator,
-            description="日期计算器，支持日期加减和差值计算",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "start_date": {
-                        "type": "string",
-                        "description": "起始日期，格式: YYYY-MM-DD"
+        universal_adapter.register_many([
+            {
+                "name": "generate_uuid",
+                "function": generate_uuid,
+                "description": "生成UUID（通用唯一标识符）",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "version": {
+                            "type": "integer",
+                            "description": "UUID版本",
+                            "enum": [1, 4],
+                            "default": 4
+                        }
                     },
-                    "operation": {
-                        "type": "string",
-                        "description": "操作类型",
-                        "enum": ["add", "subtract", "diff"],
-                        "default": "add"
+                    "required": []
+                }
+            },
+            # 注册日期计算工具
+            {
+                "name": "date_calculator",
+                "function": date_calculator,
+                "description": "日期计算器，支持日期加减和差值计算",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "start_date": {
+                            "type": "string",
+                            "description": "起始日期，格式: YYYY-MM-DD"
+                        },
+                        "operation": {
+                            "type": "string",
+                            "description": "操作类型",
+                            "enum": ["add", "subtract", "diff"],
+                            "default": "add"
+                        },
+                        "days": {
+                            "type": "integer",
+                            "description": "天数",
+                            "default": 1
+                        }
                     },
-                    "days": {
-                        "type": "integer",
-                        "description": "天数",
-                        "default": 1
-                    }
-                },
-                "required": ["start_date"]
+                    "required": ["start_date"]
+                }
             }
-        )
+        ])
         
         logger.info("Utility tools registered successfully")
     except Exception as e:
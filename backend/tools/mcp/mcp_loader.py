@@ -7,9 +7,12 @@ LangChain的最新MCP支持来完善。
 """
 
 import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, tool
 
 from ...config import config
 from ...utils.logger import get_logger
@@ -17,15 +20,35 @@ from ...utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _httpx():
+    """按需导入httpx，只有配置了API类型的MCP服务器时才加载"""
+    import httpx
+    return httpx
+
+
 class MCPToolLoader:
     """MCP工具加载器"""
     
+    __slots__ = (
+        "loaded_tools", "mcp_servers", "_http_clients",
+        "_result_cache", "_cache_ttl", "_cache_size",
+    )
+    
     def __init__(self):
         self.loaded_tools: List[BaseTool] = []
         self.mcp_servers: Dict[str, Any] = {}
+        self._http_clients: Dict[str, Any] = {}  # server_name -> httpx.AsyncClient
+        
+        # 文件系统工具的结果缓存: (工具名, 路径) -> (过期时间, 文件状态, 结果)，按LRU淘汰
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_ttl = config.MCP_TOOLS_CONFIG.get("cache_ttl", 60)
+        self._cache_size = config.MCP_TOOLS_CONFIG.get("cache_size", 256)
     
     async def load_mcp_tools(self) -> List[BaseTool]:
-        """加载MCP工具"""
+        """加载MCP工具（每次加载重新生成工具列表，重新加载时不保留旧工具）"""
+        self.loaded_tools = []
+        self.mcp_servers = {}
         try:
             mcp_config = config.MCP_TOOLS_CONFIG
             if not mcp_config.get("enabled", False):
@@ -35,11 +58,17 @@ class MCPToolLoader:
             # 获取配置的MCP服务器
             servers = mcp_config.get("servers", {})
             
-            for server_name, server_config in servers.items():
-                try:
-                    await self._load_mcp_server(server_name, server_config)
-                except Exception as e:
-                    logger.error(f"Failed to load MCP server {server_name}: {e}")
+            # 并发加载所有服务器，总耗时取决于最慢的服务器
+            results = await asyncio.gather(
+                *(self._load_mcp_server(server_name, server_config)
+                  for server_name, server_config in servers.items()),
+                return_exceptions=True
+            )
+            for server_name, result in zip(servers, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to load MCP server {server_name}: {result}")
+            
+            self._result_cache.clear()
             
             logger.info(f"Loaded {len(self.loaded_tools)} MCP tools from {len(self.mcp_servers)} servers")
             return self.loaded_tools
@@ -48,6 +77,28 @@ class MCPToolLoader:
             logger.error(f"Failed to load MCP tools: {e}")
             return []
     
+    def _cache_get(self, key: tuple) -> Optional[tuple]:
+        """返回未过期的(文件状态, 结果)，没有时返回None"""
+        if self._cache_ttl <= 0:
+            return None
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return entry[1], entry[2]
+    
+    def _cache_put(self, key: tuple, stamp: Any, result: Any):
+        """缓存结果及对应的文件状态，超出容量时淘汰最久未使用的条目"""
+        if self._cache_ttl <= 0 or stamp is None:
+            return
+        self._result_cache[key] = (time.monotonic() + self._cache_ttl, stamp, result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._cache_size:
+            self._result_cache.popitem(last=False)
+    
     async def _load_mcp_server(self, server_name: str, server_config: Dict[str, Any]):
         """加载单个MCP服务器"""
         try:
@@ -75,32 +126,63 @@ class MCPToolLoader:
         """加载文件系统MCP服务器"""
         try:
             # 示例：文件系统MCP工具
-            from langchain_core.tools import tool
-            
             base_path = config.get("base_path", "./")
+            io_timeout = config.get("timeout", 30)
+            
+            # 缓存的结果附带文件状态(修改时间, 大小)，文件被写入后状态变化，缓存自动失效
+            def _read_file(full_path: Path, cached: Optional[tuple]) -> tuple:
+                if not (full_path.exists() and full_path.is_file()):
+                    return None, None
+                stat = full_path.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                if cached is not None and cached[0] == stamp:
+                    return stamp, cached[1]
+                return stamp, full_path.read_text(encoding='utf-8')
             
+            def _list_files(full_path: Path, cached: Optional[tuple]) -> tuple:
+                if not (full_path.exists() and full_path.is_dir()):
+                    return None, None
+                stamp = full_path.stat().st_mtime_ns
+                if cached is not None and cached[0] == stamp:
+                    return stamp, cached[1]
+                return stamp, [f.name for f in full_path.iterdir()]
+            
+            # 磁盘I/O放到线程池执行，避免阻塞事件循环中的其他工具调用
             @tool
-            def read_file_mcp(file_path: str) -> str:
+            async def read_file_mcp(file_path: str) -> str:
                 """通过MCP读取文件内容"""
                 try:
                     full_path = Path(base_path) / file_path
-                    if full_path.exists() and full_path.is_file():
-                        return full_path.read_text(encoding='utf-8')
-                    else:
+                    cache_key = ("read_file_mcp", str(full_path))
+                    stamp, content = await asyncio.wait_for(
+                        asyncio.to_thread(_read_file, full_path, self._cache_get(cache_key)),
+                        timeout=io_timeout
+                    )
+                    if content is None:
                         return f"文件不存在: {file_path}"
+                    self._cache_put(cache_key, stamp, content)
+                    return content
+                except asyncio.TimeoutError:
+                    return f"读取文件超时: {file_path}"
                 except Exception as e:
                     return f"读取文件失败: {str(e)}"
             
             @tool
-            def list_files_mcp(directory: str = ".") -> str:
+            async def list_files_mcp(directory: str = ".") -> str:
                 """通过MCP列出目录文件"""
                 try:
                     full_path = Path(base_path) / directory
-                    if full_path.exists() and full_path.is_dir():
-                        files = [f.name for f in full_path.iterdir()]
-                        return f"目录 {directory} 中的文件: {', '.join(files)}"
-                    else:
+                    cache_key = ("list_files_mcp", str(full_path))
+                    stamp, files = await asyncio.wait_for(
+                        asyncio.to_thread(_list_files, full_path, self._cache_get(cache_key)),
+                        timeout=io_timeout
+                    )
+                    if files is None:
                         return f"目录不存在: {directory}"
+                    self._cache_put(cache_key, stamp, files)
+                    return f"目录 {directory} 中的文件: {', '.join(files)}"
+                except asyncio.TimeoutError:
+                    return f"列出文件超时: {directory}"
                 except Exception as e:
                     return f"列出文件失败: {str(e)}"
             
@@ -116,15 +198,13 @@ class MCPToolLoader:
         """加载数据库MCP服务器"""
         try:
             # 示例：数据库MCP工具
-            from langchain_core.tools import tool
-            
             @tool
             def query_database_mcp(query: str) -> str:
                 """通过MCP查询数据库"""
                 # 这里应该实现实际的数据库连接和查询
                 return f"数据库查询结果: {query} (示例结果)"
             
-            self.loaded_tools.append(query_database_mcp)
+            self.loaded_tools.extend([query_database_mcp])
             self.mcp_servers[server_name] = {"type": "database", "tools": 1}
             
             logger.info(f"Loaded database MCP server: {server_name}")
@@ -136,23 +216,35 @@ class MCPToolLoader:
         """加载API MCP服务器"""
         try:
             # 示例：API MCP工具
-            from langchain_core.tools import tool
-            import requests
+            httpx = _httpx()
             
             base_url = config.get("base_url", "")
             api_key = config.get("api_key", "")
+            headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+            
+            # 每个服务器共享一个连接池，复用keep-alive连接
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                headers=headers,
+                timeout=config.get("timeout", 30),
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+            # 重新加载时先关闭旧的连接池，避免旧客户端及其连接泄漏
+            old_client = self._http_clients.pop(server_name, None)
+            if old_client is not None:
+                await old_client.aclose()
+            self._http_clients[server_name] = client
             
             @tool
-            def call_api_mcp(endpoint: str, method: str = "GET", data: str = "") -> str:
+            async def call_api_mcp(endpoint: str, method: str = "GET", data: str = "") -> str:
                 """通过MCP调用API"""
                 try:
-                    url = f"{base_url}/{endpoint.lstrip('/')}"
-                    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+                    path = endpoint.lstrip('/')
                     
                     if method.upper() == "GET":
-                        response = requests.get(url, headers=headers)
+                        response = await client.get(path)
                     elif method.upper() == "POST":
-                        response = requests.post(url, headers=headers, json=data)
+                        response = await client.post(path, json=data)
                     else:
                         return f"不支持的HTTP方法: {method}"
                     
@@ -160,7 +252,7 @@ class MCPToolLoader:
                 except Exception as e:
                     return f"API调用失败: {str(e)}"
             
-            self.loaded_tools.append(call_api_mcp)
+            self.loaded_tools.extend([call_api_mcp])
             self.mcp_servers[server_name] = {"type": "api", "tools": 1}
             
             logger.info(f"Loaded API MCP server: {server_name}")
@@ -177,6 +269,15 @@ class MCPToolLoader:
         except Exception as e:
             logger.error(f"Failed to load custom MCP server {server_name}: {e}")
     
+    async def close(self):
+        """关闭API服务器的HTTP连接池"""
+        for server_name, client in list(self._http_clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP client for MCP server {server_name}: {e}")
+        self._http_clients.clear()
+    
     def get_server_info(self) -> Dict[str, Any]:
         """获取MCP服务器信息"""
         return {
@@ -12,51 +12,121 @@
 3. 统一注册到工具服务中
 """
 
+import ast
+import asyncio
+import hashlib
 import importlib
+import importlib.util
 import inspect
-from typing import List, Dict, Optional
+import os
+import re
+import sys
+from types import ModuleType
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, tool as _tool_decorator
 
 from ..config import config
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 扫描模块成员时跳过的导入名称
+_SKIP_NAMES = frozenset({'BaseTool', 'StructuredTool', 'tool', 'BaseModel', 'Field'})
+
+# 目录遍历时跳过的条目：特殊文件（__init__.py、__pycache__等）和测试文件
+_SKIP_ENTRY_RE = re.compile(r"__|test_").match
+
+# 文件中出现这些名称或定义了公开的顶层函数（会被自动转换为工具）才可能定义了工具，否则跳过导入
+_TOOL_MARKERS = frozenset({'BaseTool', 'StructuredTool', 'tool'})
+
 
 class UnifiedToolLoader:
     """统一工具加载器"""
     
+    __slots__ = ("loaded_tools", "tool_sources", "_file_cache", "_dir_cache", "_disabled")
+    
     def __init__(self):
         self.loaded_tools: List[BaseTool] = []
         self.tool_sources: Dict[str, str] = {}  # tool_name -> source_type
+        # 文件发现缓存: 文件路径 -> (mtime_ns, 工具列表)，文件未修改时不再重新导入
+        self._file_cache: Dict[str, Tuple[int, List[BaseTool]]] = {}
+        # 目录遍历缓存: 目录路径 -> (各级目录mtime_ns, 模块列表)
+        self._dir_cache: Dict[str, Tuple[Tuple[Tuple[str, int], ...], List[Tuple[Optional[str], Path]]]] = {}
+        # 配置中被禁用的工具名称，启用检查只需一次集合查找
+        self._disabled: frozenset = frozenset()
+        self.refresh_tool_config()
+    
+    def refresh_tool_config(self):
+        """根据BUILTIN_TOOLS_CONFIG重建禁用工具集合（配置变更后调用）"""
+        self._disabled = frozenset(
+            name for name, settings in config.BUILTIN_TOOLS_CONFIG.items()
+            if not settings.get("enabled", True)
+        )
     
     async def load_all_tools(self) -> List[BaseTool]:
         """加载所有配置的工具"""
-        self.loaded_tools.clear()
-        self.tool_sources.clear()
-        
         loading_config = config.TOOL_LOADING_CONFIG
+        loaders = []
         
         # 1. 加载内置示例工具
         if loading_config.get("auto_load_builtin", True):
-            await self._load_builtin_tools()
+            loaders.append(self._load_builtin_tools())
         
         # 2. 加载LangChain社区工具
         if loading_config.get("auto_load_community", True):
-            await self._load_community_tools()
+            loaders.append(self._load_community_tools())
         
         # 3. 加载自定义工具
         if loading_config.get("auto_load_custom", True):
-            await self._load_custom_tools()
+            loaders.append(self._load_custom_tools())
         
         # 4. 加载MCP工具
         if loading_config.get("auto_load_mcp", False):
-            await self._load_mcp_tools()
+            loaders.append(self._load_mcp_tools())
+        
+        # 各来源并发加载，MCP服务器连接等I/O不再串行等待
+        results = await asyncio.gather(*loaders, return_exceptions=True)
+        
+        # 全部返回后按来源顺序统一合并，结果与串行加载一致
+        self.loaded_tools.clear()
+        self.tool_sources.clear()
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Tool loader failed: {result}")
+                continue
+            for tool, source_type in result:
+                if not self._register(tool, source_type):
+                    logger.warning(f"Duplicate tool {tool.name} from {source_type} ignored")
         
         logger.info(f"Loaded {len(self.loaded_tools)} tools from {len(set(self.tool_sources.values()))} sources")
         return self.loaded_tools
 
+    def _register(self, tool: BaseTool, source_type: str) -> bool:
+        """登记已加载的工具，同名工具只保留第一个"""
+        if tool.name in self.tool_sources:
+            return False
+        self.loaded_tools.append(tool)
+        self.tool_sources[tool.name] = source_type
+        return True
+
+    async def reload_tools(self) -> Tuple[List[BaseTool], List[str]]:
+        """
+        重新加载工具，未修改的文件直接复用缓存
+
+        Returns:
+            (新增或发生变化的工具, 已移除的工具名称)
+        """
+        self.refresh_tool_config()
+        previous = {tool.name: tool for tool in self.loaded_tools}
+        current = {tool.name: tool for tool in await self.load_all_tools()}
+
+        changed = [tool for name, tool in current.items() if previous.get(name) is not tool]
+        removed = [name for name in previous if name not in current]
+
+        logger.info(f"Reloaded tools: {len(changed)} added or updated, {len(removed)} removed")
+        return changed, removed
+
     async def _load_tools_from_directory(self, directory: Path, source_type: str) -> List[BaseTool]:
         """从目录加载工具"""
         tools = []
@@ -65,80 +135,117 @@ class UnifiedToolLoader:
             logger.info(f"{source_type} tools directory not found: {directory}")
             return tools
 
-        # 扫描目录中的所有.py文件
-        for file_path in directory.rglob("*.py"):
-            if file_path.name.startswith("__") or file_path.name.startswith("test_"):
+        # 先收集目录中的所有工具模块，再在线程中并发加载
+        modules = self._list_tool_modules(directory)
+        results = await asyncio.gather(
+            *(self._load_tools_from_file(file_path, module_name) for module_name, file_path in modules),
+            return_exceptions=True
+        )
+
+        for (module_name, file_path), file_tools in zip(modules, results):
+            if isinstance(file_tools, BaseException):
+                logger.warning(f"Failed to load tools from {file_path}: {file_tools}")
                 continue
+            for tool in file_tools:
+                if self._is_tool_enabled(tool.name):
+                    tools.append(tool)
+                    logger.debug(f"Loaded {source_type} tool: {tool.name} from {file_path.name}")
 
+        return tools
+
+    def _list_tool_modules(self, directory: Path) -> List[Tuple[Optional[str], Path]]:
+        """
+        递归列出目录中的工具模块，返回[(模块名, 文件路径)]
+
+        目录是Python包时返回可导入的模块名；不是包时模块名为None，按文件路径加载。
+        结果按各级目录的mtime_ns缓存，目录内容未变化时不再重新遍历。
+        """
+        cache_key = str(directory)
+        cached = self._dir_cache.get(cache_key)
+        if cached is not None:
+            dir_mtimes, modules = cached
             try:
-                file_tools = await self._load_tools_from_file(file_path)
-                for tool in file_tools:
-                    if self._is_tool_enabled(tool.name):
-                        self.loaded_tools.append(tool)
-                        self.tool_sources[tool.name] = source_type
-                        tools.append(tool)
-                        logger.debug(f"Loaded {source_type} tool: {tool.name} from {file_path.name}")
-            except Exception as e:
-                logger.warning(f"Failed to load tools from {file_path}: {e}")
+                if all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in dir_mtimes):
+                    return modules
+            except OSError:
+                pass
 
-        return tools
+        package = f"{__package__}.{directory.name}"
+        dir_mtimes: List[Tuple[str, int]] = []
+        modules = list(self._scandir_recursive(directory, package, dir_mtimes))
+        self._dir_cache[cache_key] = (tuple(dir_mtimes), modules)
+        return modules
+
+    def _scandir_recursive(self, directory: Path, package: Optional[str],
+                           dir_mtimes: List[Tuple[str, int]]) -> Iterator[Tuple[Optional[str], Path]]:
+        """基于os.scandir的递归遍历，直接使用DirEntry的类型缓存，不再逐个stat"""
+        try:
+            dir_mtimes.append((str(directory), os.stat(directory).st_mtime_ns))
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.warning(f"Failed to scan tools directory {directory}: {e}")
+            return
 
-    async def _load_builtin_tools(self):
+        if package is not None and not any(entry.name == "__init__.py" for entry in entries):
+            package = None
+
+        for entry in entries:
+            name = entry.name
+            if _SKIP_ENTRY_RE(name):
+                continue
+
+            if entry.is_dir(follow_symlinks=False):
+                subpackage = f"{package}.{name}" if package is not None else None
+                yield from self._scandir_recursive(Path(entry.path), subpackage, dir_mtimes)
+            elif name.endswith(".py") and entry.is_file():
+                stem = name[:-3]
+                module_name = f"{package}.{stem}" if package is not None else None
+                yield module_name, Path(entry.path)
+
+    async def _load_builtin_tools(self) -> List[Tuple[BaseTool, str]]:
         """加载内置工具（从独立的.py文件）"""
         try:
             builtin_dir = Path(__file__).parent / "builtin"
             tools = await self._load_tools_from_directory(builtin_dir, "builtin")
 
             logger.info(f"Loaded {len(tools)} builtin tools")
+            return [(tool, "builtin") for tool in tools]
         except Exception as e:
             logger.error(f"Failed to load builtin tools: {e}")
+            return []
     
-    async def _load_community_tools(self):
+    async def _load_community_tools(self) -> List[Tuple[BaseTool, str]]:
         """加载社区工具（从独立的.py文件）"""
         try:
             community_dir = Path(__file__).parent / "community"
             tools = await self._load_tools_from_directory(community_dir, "community")
 
             logger.info(f"Loaded {len(tools)} community tools")
+            return [(tool, "community") for tool in tools]
         except Exception as e:
             logger.error(f"Failed to load community tools: {e}")
+            return []
     
-    async def _load_custom_tools(self):
-        """加载自定义工具"""
+    async def _load_custom_tools(self) -> List[Tuple[BaseTool, str]]:
+        """加载自定义工具（从backend/tools/custom目录）"""
         try:
-            # 从backend/tools/custom目录加载
             custom_tools_dir = Path(__file__).parent / "custom"
+            tools = await self._load_tools_from_directory(custom_tools_dir, "custom")
 
-            if not custom_tools_dir.exists():
-                logger.info("Custom tools directory not found")
-                return
-
-            # 扫描自定义工具目录
-            for file_path in custom_tools_dir.rglob("*.py"):
-                if file_path.name.startswith("__") or file_path.name.startswith("test_"):
-                    continue
-
-                try:
-                    tools = await self._load_tools_from_file(file_path)
-                    for tool in tools:
-                        self.loaded_tools.append(tool)
-                        self.tool_sources[tool.name] = "custom"
-
-                    if tools:
-                        logger.info(f"Loaded {len(tools)} custom tools from {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to load custom tools from {file_path}: {e}")
-
+            logger.info(f"Loaded {len(tools)} custom tools")
+            return [(tool, "custom") for tool in tools]
         except Exception as e:
             logger.error(f"Failed to load custom tools: {e}")
+            return []
     
-    async def _load_mcp_tools(self):
+    async def _load_mcp_tools(self) -> List[Tuple[BaseTool, str]]:
         """加载MCP工具"""
         try:
             mcp_config = config.MCP_TOOLS_CONFIG
             if not mcp_config.get("enabled", False):
                 logger.info("MCP tools disabled in config")
-                return
+                return []
 
             # 导入MCP加载器
             from .mcp.mcp_loader import get_mcp_loader
@@ -147,36 +254,115 @@ class UnifiedToolLoader:
             mcp_loader = get_mcp_loader()
             mcp_tools = await mcp_loader.load_mcp_tools()
 
-            for tool in mcp_tools:
-                self.loaded_tools.append(tool)
-                self.tool_sources[tool.name] = "mcp"
-
             if mcp_tools:
                 server_info = mcp_loader.get_server_info()
                 logger.info(f"Loaded {len(mcp_tools)} MCP tools from {server_info['total_servers']} servers")
+            return [(tool, "mcp") for tool in mcp_tools]
 
         except Exception as e:
             logger.error(f"Failed to load MCP tools: {e}")
+            return []
     
     def _is_tool_enabled(self, tool_name: str) -> bool:
         """检查工具是否启用"""
-        builtin_config = config.BUILTIN_TOOLS_CONFIG
-        return builtin_config.get(tool_name, {}).get("enabled", True)
+        return tool_name not in self._disabled
     
-    async def _load_tools_from_file(self, file_path: Path) -> List[BaseTool]:
-        """从文件加载工具"""
+    def _load_module_from_path(self, file_path: Path, reload: bool = False) -> ModuleType:
+        """按文件路径执行模块（仅用于非包目录），reload为False时复用已加载的模块"""
+        # 由路径生成唯一且稳定的模块名，不同文件不再共用同一个模块名
+        path_digest = hashlib.md5(str(file_path.resolve()).encode("utf-8")).hexdigest()[:8]
+        module_name = f"{__package__}._dyn_tools.{file_path.stem}_{path_digest}"
+
+        module = sys.modules.get(module_name)
+        if module is not None and not reload:
+            return module
+
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        # 执行前先登记到sys.modules，工具文件之间的相互导入可以正常解析
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return module
+
+    def _may_define_tools(self, file_path: Path) -> bool:
+        """
+        解析语法树，判断文件是否可能定义工具（解析失败时按可能定义处理）
+
+        引用了工具相关名称，或定义了公开的顶层函数（加载时会尝试自动转换为工具）
+        """
+        try:
+            tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
+        except (SyntaxError, ValueError, OSError):
+            return True
+
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name[:1] != '_':
+                return True
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                name = node.id
+            elif isinstance(node, ast.Attribute):
+                name = node.attr
+            elif isinstance(node, ast.alias):
+                name = node.asname or node.name
+            else:
+                continue
+            if name in _TOOL_MARKERS:
+                return True
+        return False
+
+    async def _load_tools_from_file(self, file_path: Path, module_name: Optional[str]) -> List[BaseTool]:
+        """从文件加载工具（模块导入是阻塞操作，放到线程中执行，不占用事件循环）"""
+        return await asyncio.to_thread(self._sync_load_from_file, file_path, module_name)
+
+    def _sync_load_from_file(self, file_path: Path, module_name: Optional[str]) -> List[BaseTool]:
+        """从文件加载工具（同步实现）"""
+        cache_key = str(file_path)
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError as e:
+            logger.error(f"Error loading tools from {file_path}: {e}")
+            return []
+
+        cached = self._file_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+
+        # 导入前先做语法树预检，不涉及工具定义的文件不执行导入
+        if not self._may_define_tools(file_path):
+            logger.debug(f"Skipped {file_path.name}: no tool definitions")
+            self._file_cache[cache_key] = (mtime_ns, [])
+            return []
+
         tools = []
         
         try:
-            # 动态导入模块
-            spec = importlib.util.spec_from_file_location("custom_tool", file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            if module_name is None:
+                # 目录不是包，按文件路径加载
+                module = self._load_module_from_path(file_path, reload=cached is not None)
+            elif cached is not None and module_name in sys.modules:
+                # 文件修改后才重新加载模块
+                module = importlib.reload(sys.modules[module_name])
+            else:
+                # 首次加载走导入缓存，可复用字节码缓存
+                module = importlib.import_module(module_name)
             
-            # 查找工具对象
-            for name, obj in inspect.getmembers(module):
+            # 查找工具对象：优先只检查__all__导出的名称，没有__all__时直接遍历模块字典
+            # （vars()不像inspect.getmembers那样逐个getattr并排序）
+            exported = getattr(module, "__all__", None)
+            if exported is not None:
+                members = [(name, getattr(module, name, None)) for name in exported]
+            else:
+                members = list(vars(module).items())
+
+            for name, obj in members:
                 # 跳过私有属性和导入的类
-                if name.startswith('_') or name in ['BaseTool', 'StructuredTool', 'tool', 'BaseModel', 'Field']:
+                if name[:1] == '_' or name in _SKIP_NAMES:
                     continue
 
                 if isinstance(obj, BaseTool):
@@ -184,154 +370,84 @@ class UnifiedToolLoader:
                 elif callable(obj) and hasattr(obj, '__annotations__') and not inspect.isclass(obj):
                     # 只转换函数，不转换类
                     try:
-                        from langchain_core.tools import tool
                         if hasattr(obj, '_langchain_tool'):  # 已经是@tool装饰的函数
                             tools.append(obj)
                         else:
                             # 尝试转换为工具
-                            tool_obj = tool(obj)
+                            tool_obj = _tool_decorator(obj)
                             tools.append(tool_obj)
                     except Exception as e:
                         logger.debug(f"Failed to convert {name} to tool: {e}")
                         pass
         
+            self._file_cache[cache_key] = (mtime_ns, list(tools))
         except Exception as e:
             logger.error(f"Error loading tools from {file_path}: {e}")
         
         return tools
     
-    # LangChain社区工具加载方法
-    async def _load_wikipedia_tool(self) -> Optional[BaseTool]:
-        """加载Wikipedia工具"""
-        try:
-            from langchain_community.tools import WikipediaQueryRun
-            from langchain_community.utilities import WikipediaAPIWrapper
-            
-            wikipedia = WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper())
-            return wikipedia
-        except ImportError:
-            logger.warning("Wikipedia tool requires: pip install wikipedia")
-            return None
-    
-    async def _load_duckduckgo_tool(self) -> Optional[BaseTool]:
-        """加载DuckDuckGo搜索工具"""
-        try:
-            from langchain_community.tools import DuckDuckGoSearchRun
-            
-            search = DuckDuckGoSearchRun()
-            return search
-        except ImportError:
-            logger.warning("DuckDuckGo tool requires: pip install duckduckgo-search")
-            return None
-    
-    async def _load_python_repl_tool(self) -> Optional[BaseTool]:
-        """加载Python REPL工具"""
-        try:
-            from langchain_experimental.tools import PythonREPLTool
-            
-            python_repl = PythonREPLTool()
-            return python_repl
-        except ImportError:
-            logger.warning("Python REPL tool requires: pip install langchain-experimental")
-            return None
-    
-    async def _load_shell_tool(self) -> Optional[BaseTool]:
-        """加载Shell工具"""
-        try:
-            from langchain_community.tools import ShellTool
-            
-            shell = ShellTool()
-            return shell
-        except ImportError:
-            logger.warning("Shell tool not available")
-            return None
-    
-    async def _load_requests_tool(self) -> Optional[BaseTool]:
-        """加载Requests工具"""
-        try:
-            from langchain_community.tools import RequestsGetTool
-            
-            requests_tool = RequestsGetTool()
-            return requests_tool
-        except ImportError:
-            logger.warning("Requests tool not available")
-            return None
-    
-    async def _load_arxiv_tool(self) -> Optional[BaseTool]:
-        """加载ArXiv工具"""
-        try:
-            from langchain_community.tools import ArxivQueryRun
-            from langchain_community.utilities import ArxivAPIWrapper
-            
-            arxiv = ArxivQueryRun(api_wrapper=ArxivAPIWrapper())
-            return arxiv
-        except ImportError:
-            logger.warning("ArXiv tool requires: pip install arxiv")
-            return None
-    
-    async def _load_wolfram_tool(self) -> Optional[BaseTool]:
-        """加载Wolfram Alpha工具"""
-        try:
-            api_key = config.get_api_key("wolfram")
-            if not api_key:
-                logger.warning("Wolfram Alpha tool requires API key")
-                return None
-            
-            from langchain_community.tools import WolframAlphaQueryRun
-            from langchain_community.utilities import WolframAlphaAPIWrapper
-            
-            wolfram = WolframAlphaQueryRun(
-                api_wrapper=WolframAlphaAPIWrapper(wolfram_alpha_appid=api_key)
-            )
-            return wolfram
-        except ImportError:
-            logger.warning("Wolfram Alpha tool requires: pip install wolframalpha")
+    async def _load_community_by_name(self, name: str) -> Optional[BaseTool]:
+        """按名称加载LangChain社区工具，仅在配置中启用时才导入对应模块"""
+        spec = _COMMUNITY_FACTORIES.get(name)
+        if spec is None or not self._is_tool_enabled(name):
             return None
-    
-    async def _load_google_search_tool(self) -> Optional[BaseTool]:
-        """加载Google搜索工具"""
-        try:
-            api_key = config.get_api_key("google")
-            cse_id = config.GOOGLE_CSE_ID
-            
-            if not api_key or not cse_id:
-                logger.warning("Google Search tool requires API key and CSE ID")
-                return None
-            
-            from langchain_community.tools import GoogleSearchRun
-            from langchain_community.utilities import GoogleSearchAPIWrapper
-            
-            search = GoogleSearchRun(
-                api_wrapper=GoogleSearchAPIWrapper(
-                    google_api_key=api_key,
-                    google_cse_id=cse_id
-                )
-            )
-            return search
-        except ImportError:
-            logger.warning("Google Search tool requires: pip install google-api-python-client")
-            return None
-    
-    async def _load_bing_search_tool(self) -> Optional[BaseTool]:
-        """加载Bing搜索工具"""
+
+        tool_module, tool_class, wrapper_module, wrapper_class, wrapper_kwargs = spec
         try:
-            api_key = config.get_api_key("bing")
-            if not api_key:
-                logger.warning("Bing Search tool requires API key")
-                return None
-            
-            from langchain_community.tools import BingSearchRun
-            from langchain_community.utilities import BingSearchAPIWrapper
-            
-            search = BingSearchRun(
-                api_wrapper=BingSearchAPIWrapper(bing_subscription_key=api_key)
-            )
-            return search
-        except ImportError:
-            logger.warning("Bing Search tool not available")
+            kwargs = {}
+            if wrapper_module is not None:
+                params = wrapper_kwargs() if wrapper_kwargs is not None else {}
+                if params is None:
+                    logger.warning(f"{name} tool requires API key")
+                    return None
+                wrapper = getattr(importlib.import_module(wrapper_module), wrapper_class)
+                kwargs["api_wrapper"] = wrapper(**params)
+
+            tool_cls = getattr(importlib.import_module(tool_module), tool_class)
+            return tool_cls(**kwargs)
+        except ImportError as e:
+            logger.warning(f"{name} tool not available: {e}")
             return None
 
 
+def _wolfram_kwargs() -> Optional[Dict[str, str]]:
+    api_key = config.get_api_key("wolfram")
+    return {"wolfram_alpha_appid": api_key} if api_key else None
+
+
+def _google_search_kwargs() -> Optional[Dict[str, str]]:
+    api_key = config.get_api_key("google")
+    cse_id = config.GOOGLE_CSE_ID
+    if not api_key or not cse_id:
+        return None
+    return {"google_api_key": api_key, "google_cse_id": cse_id}
+
+
+def _bing_search_kwargs() -> Optional[Dict[str, str]]:
+    api_key = config.get_api_key("bing")
+    return {"bing_subscription_key": api_key} if api_key else None
+
+
+# LangChain社区工具注册表: 名称 -> (工具模块, 工具类, 包装器模块, 包装器类, 包装器参数)
+# 模块只在工具被加载时才导入
+_COMMUNITY_FACTORIES: Dict[str, Tuple[str, str, Optional[str], Optional[str], Optional[Callable[[], Optional[Dict[str, str]]]]]] = {
+    "wikipedia": ("langchain_community.tools", "WikipediaQueryRun",
+                  "langchain_community.utilities", "WikipediaAPIWrapper", None),
+    "duckduckgo_search": ("langchain_community.tools", "DuckDuckGoSearchRun", None, None, None),
+    "python_repl": ("langchain_experimental.tools", "PythonREPLTool", None, None, None),
+    "shell": ("langchain_community.tools", "ShellTool", None, None, None),
+    "requests": ("langchain_community.tools", "RequestsGetTool", None, None, None),
+    "arxiv": ("langchain_community.tools", "ArxivQueryRun",
+              "langchain_community.utilities", "ArxivAPIWrapper", None),
+    "wolfram_alpha": ("langchain_community.tools", "WolframAlphaQueryRun",
+                      "langchain_community.utilities", "WolframAlphaAPIWrapper", _wolfram_kwargs),
+    "google_search": ("langchain_community.tools", "GoogleSearchRun",
+                      "langchain_community.utilities", "GoogleSearchAPIWrapper", _google_search_kwargs),
+    "bing_search": ("langchain_community.tools", "BingSearchRun",
+                    "langchain_community.utilities", "BingSearchAPIWrapper", _bing_search_kwargs),
+}
+
+
 # 全局工具加载器实例
 _tool_loader_instance: Optional[UnifiedToolLoader] = None
 
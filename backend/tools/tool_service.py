@@ -9,10 +9,23 @@ Agent通过此服务调用工具，不直接处理工具管理逻辑
 直接基于LangChain实现，无需额外的管理层
 """
 
+import asyncio
+import inspect
 import json
-from typing import Dict, Any, List, Optional, Callable
+import sys
+import weakref
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Callable, Sequence, Tuple
 from abc import ABC, abstractmethod
-from langchain_core.tools import BaseTool, tool, Tool, StructuredTool
+from langchain_core.tools import BaseTool, tool, StructuredTool
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 try:
     from pydantic import BaseModel
@@ -24,6 +37,9 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 参数模型类 -> JSON Schema，多个工具共用或重新加载未变化的模块时复用；模块重载后旧类自动释放
+_SCHEMA_CACHE: "weakref.WeakKeyDictionary[type, Optional[Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+
 # 导入统一工具适配器
 try:
     from .adapters.universal_tool_adapter import universal_adapter, auto_discovery
@@ -36,8 +52,20 @@ except ImportError as e:
     auto_discovery = None
 
 
+def _dumps_compact(data: Any) -> str:
+    """紧凑JSON序列化（无缩进、保留中文），安装了orjson时使用orjson"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
 class ToolServiceInterface(ABC):
     """工具服务接口"""
+
+    __slots__ = ()
     
     @abstractmethod
     async def initialize(self, llm=None, provider: str = None, model: str = None) -> bool:
@@ -65,7 +93,7 @@ class ToolServiceInterface(ABC):
         pass
     
     @abstractmethod
-    def list_tool_names(self) -> List[str]:
+    def list_tool_names(self) -> Sequence[str]:
         """列出所有工具名称"""
         pass
 
@@ -78,6 +106,14 @@ class ToolService(ToolServiceInterface):
     Agent只需要调用此服务，不需要了解具体的工具管理逻辑
     """
 
+    # 固定属性集合，实例不再携带__dict__；新增属性需同步加入此处
+    __slots__ = (
+        "llm", "provider", "model", "supports_native_tools",
+        "tools", "_initialized", "_init_locks",
+        "_description_cache", "_tool_descriptions", "_schema_cache",
+        "_tool_types", "_invokers", "_stats_view", "_tool_names",
+    )
+
     def __init__(self):
         self.llm = None
         self.provider = None
@@ -87,23 +123,51 @@ class ToolService(ToolServiceInterface):
         # 工具存储 - 统一使用LangChain BaseTool接口
         self.tools: Dict[str, BaseTool] = {}
         self._initialized = False
+        # 每个事件循环一把初始化锁：服务是进程级单例，Gradio前端和FastAPI可能在不同事件循环中初始化，
+        # asyncio.Lock不能跨事件循环使用
+        self._init_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+        # 工具描述文本和统计信息缓存，工具增删时失效
+        self._description_cache: Optional[str] = None
+        self._tool_descriptions: Dict[str, str] = {}  # 工具名称 -> 描述片段
+        self._schema_cache: Dict[str, Optional[Dict[str, Any]]] = {}  # 工具名称 -> 参数Schema
+        self._tool_types: Dict[str, str] = {}  # 工具名称 -> 工具类型名
+        self._invokers: Dict[str, Tuple[Optional[Callable], bool, bool]] = {}  # 工具名称 -> (执行函数, 是否以字典传参, 是否异步)
+        self._stats_view: Optional[Mapping[str, Any]] = None
+        self._tool_names: Optional[Tuple[str, ...]] = None
+
+    def _get_init_lock(self) -> asyncio.Lock:
+        """获取当前事件循环的初始化锁，首次使用时创建"""
+        loop = asyncio.get_running_loop()
+        lock = self._init_locks.get(loop)
+        if lock is None:
+            lock = self._init_locks[loop] = asyncio.Lock()
+        return lock
 
     async def initialize(self, llm=None, provider: str = None, model: str = None) -> bool:
         """初始化工具服务"""
         try:
-            self.llm = llm
-            self.provider = provider
-            self.model = model
-
-            # 检测模型是否支持原生工具调用
-            self.supports_native_tools = config.model_supports_tools(provider, model) if provider and model else True
-
-            # 加载所有工具
-            await self._load_all_tools()
-
-            self._initialized = True
-            logger.info("ToolService initialized successfully")
-            return True
+            # 多个Agent并发初始化时只加载一次工具
+            async with self._get_init_lock():
+                self.llm = llm
+                self.provider = provider
+                self.model = model
+
+                # 检测模型是否支持原生工具调用（config中按模型缓存）
+                self.supports_native_tools = config.model_supports_tools(provider, model) if provider and model else True
+                self._stats_view = None
+
+                if self._initialized:
+                    # 工具已加载，只更新模型相关信息
+                    return True
+
+                # 加载所有工具
+                await self._load_all_tools()
+
+                self._initialized = True
+                self._stats_view = None
+                logger.info("ToolService initialized successfully")
+                return True
 
         except Exception as e:
             logger.error(f"Failed to initialize ToolService: {e}")
@@ -116,7 +180,8 @@ class ToolService(ToolServiceInterface):
 
             # 使用统一工具加载器
             tool_loader = get_tool_loader()
-            tools = await tool_loader.load_all_tools()
+            # 复制一份，下面追加适配器工具时不修改加载器自身的列表
+            tools = list(await tool_loader.load_all_tools())
 
             # 注册所有工具到统一适配器
             if UNIVERSAL_ADAPTER_AVAILABLE and universal_adapter:
@@ -131,9 +196,8 @@ class ToolService(ToolServiceInterface):
 
                 logger.info(f"Universal adapter registered {len(adapter_tools)} additional tools")
 
-            # 注册所有工具
-            for tool in tools:
-                self.add_tool(tool)
+            # 批量注册所有工具
+            self._add_tools_bulk(tools)
 
             logger.info(f"Loaded {len(tools)} tools from unified loader")
         except Exception as e:
@@ -141,13 +205,27 @@ class ToolService(ToolServiceInterface):
             # 降级到示例工具
             await self._load_example_tools()
 
+    async def reload_tools(self) -> Dict[str, Any]:
+        """增量重新加载工具，只替换新增、修改或删除的工具"""
+        from .tool_loader import get_tool_loader
+
+        changed, removed = await get_tool_loader().reload_tools()
+
+        for tool_name in removed:
+            self.remove_tool(tool_name)
+        self._add_tools_bulk(changed)
+
+        return {
+            "updated": [tool.name for tool in changed],
+            "removed": removed
+        }
+
     async def _load_example_tools(self):
         """加载示例工具（降级方案）"""
         try:
             from .builtin.example_tools import get_example_tools
 
-            for tool in get_example_tools():
-                self.add_tool(tool)
+            self._add_tools_bulk(get_example_tools())
 
             logger.info("Example tools loaded successfully")
         except Exception as e:
@@ -167,31 +245,25 @@ class ToolService(ToolServiceInterface):
         if not self.tools:
             return "当前没有可用的工具。"
 
-        descriptions = []
-        for tool_name, tool_obj in self.tools.items():
-            # 获取工具参数信息
-            params_info = ""
-            if hasattr(tool_obj, 'args_schema') and tool_obj.args_schema:
-                try:
-                    # 使用新的model_json_schema方法
-                    if hasattr(tool_obj.args_schema, 'model_json_schema'):
-                        schema = tool_obj.args_schema.model_json_schema()
-                    elif hasattr(tool_obj.args_schema, 'schema'):
-                        schema = tool_obj.args_schema.schema()
-                    else:
-                        schema = {}
-                    if 'properties' in schema:
-                        params_info = f"\n参数: {json.dumps(schema['properties'], ensure_ascii=False, indent=2)}"
-                except Exception as e:
-                    logger.debug(f"Failed to get schema for tool {tool_name}: {e}")
-
-            description = f"""
+        if self._description_cache is not None:
+            return self._description_cache
+
+        # 各工具的描述片段在注册时已生成，这里只做一次拼接
+        self._description_cache = "\n".join(self._tool_descriptions.values())
+        return self._description_cache
+
+    def _render_tool_description(self, tool_name: str, tool_obj: BaseTool) -> str:
+        """生成单个工具的描述片段"""
+        # 获取工具参数信息（注册时已生成）
+        params_info = ""
+        schema = self._schema_cache.get(tool_name)
+        if schema and 'properties' in schema:
+            params_info = f"\n参数: {_dumps_compact(schema['properties'])}"
+
+        return f"""
 **{tool_name}**
 描述: {tool_obj.description}{params_info}
 """
-            descriptions.append(description)
-
-        return "\n".join(descriptions)
 
     async def execute_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """执行指定工具"""
@@ -207,20 +279,19 @@ class ToolService(ToolServiceInterface):
                 "result": f"工具 {tool_name} 不存在"
             }
 
+        # 执行函数和调用约定在注册时确定
+        invoker, takes_dict, is_async = self._invokers[tool_name]
+        if invoker is None:
+            return {
+                "success": False,
+                "result": f"工具 {tool_name} 没有可执行的方法"
+            }
+
         try:
-            tool_obj = self.tools[tool_name]
-
-            # 使用LangChain标准的run方法执行工具
-            if hasattr(tool_obj, 'run'):
-                result = tool_obj.run(kwargs)
-            elif hasattr(tool_obj, 'func'):
-                # 对于Tool类型的工具
-                result = tool_obj.func(**kwargs)
-            else:
-                return {
-                    "success": False,
-                    "result": f"工具 {tool_name} 没有可执行的方法"
-                }
+            call = partial(invoker, kwargs) if takes_dict else partial(invoker, **kwargs)
+
+            # 异步接口直接await，同步工具在线程中执行，不阻塞事件循环
+            result = await call() if is_async else await asyncio.to_thread(call)
 
             # 标准化返回格式
             if isinstance(result, dict):
@@ -243,64 +314,140 @@ class ToolService(ToolServiceInterface):
         if not self._initialized:
             return None
 
-        if tool_name not in self.tools:
+        tool_obj = self.tools.get(tool_name)
+        if tool_obj is None:
             return None
 
-        tool_obj = self.tools[tool_name]
         info = {
             "name": tool_obj.name,
             "description": tool_obj.description,
             "supports_native": self.supports_native_tools,
-            "type": type(tool_obj).__name__
+            "type": self._tool_types[tool_name]
         }
 
-        # 获取参数信息
-        if hasattr(tool_obj, 'args_schema') and tool_obj.args_schema:
-            try:
-                if hasattr(tool_obj.args_schema, 'model_json_schema'):
-                    info["parameters"] = tool_obj.args_schema.model_json_schema()
-                else:
-                    info["parameters"] = {}
-            except Exception as e:
-                logger.debug(f"Failed to get parameters for tool {tool_name}: {e}")
-                info["parameters"] = {}
-        else:
-            info["parameters"] = {}
+        # 获取参数信息（注册时已生成）
+        schema = self._schema_cache.get(tool_name)
+        info["parameters"] = dict(schema) if schema else {}
 
         return info
 
-    def list_tool_names(self) -> List[str]:
-        """列出所有工具名称"""
+    def list_tool_names(self) -> Tuple[str, ...]:
+        """列出所有工具名称（缓存的元组，工具变化时才重新生成）"""
         if not self._initialized:
-            return []
-        return list(self.tools.keys())
+            return ()
+        if self._tool_names is None:
+            self._tool_names = tuple(self.tools)
+        return self._tool_names
     
-    def get_stats(self) -> Dict[str, Any]:
-        """获取工具服务统计信息"""
-        return {
-            "initialized": self._initialized,
-            "total_tools": len(self.tools),
-            "supports_native_tools": self.supports_native_tools,
-            "provider": self.provider,
-            "model": self.model,
-            "tool_names": list(self.tools.keys()),
-            "tool_types": [type(tool).__name__ for tool in self.tools.values()]
-        }
+    def get_stats(self) -> Mapping[str, Any]:
+        """获取工具服务统计信息（只读视图，工具变化时才重新生成）"""
+        if self._stats_view is None:
+            self._stats_view = MappingProxyType({
+                "initialized": self._initialized,
+                "total_tools": len(self.tools),
+                "supports_native_tools": self.supports_native_tools,
+                "provider": self.provider,
+                "model": self.model,
+                "tool_names": tuple(self._tool_types),
+                "tool_types": tuple(self._tool_types.values())
+            })
+        return self._stats_view
+
+    def _build_schema(self, tool_obj: BaseTool) -> Optional[Dict[str, Any]]:
+        """生成工具参数的JSON Schema（Pydantic生成开销较大，每个工具只生成一次）"""
+        args_schema = getattr(tool_obj, 'args_schema', None)
+        if not args_schema:
+            return None
+        cacheable = isinstance(args_schema, type)
+        if cacheable and args_schema in _SCHEMA_CACHE:
+            return _SCHEMA_CACHE[args_schema]
+
+        # 没有字段的参数模型无需走完整的Schema生成
+        fields = getattr(args_schema, '__pydantic_fields__', None)
+        if fields is None:
+            fields = getattr(args_schema, '__fields__', None)
+        if fields is not None and not fields:
+            schema = {"properties": {}, "title": args_schema.__name__, "type": "object"}
+        else:
+            # 使用新的model_json_schema方法，旧版Pydantic退回schema()
+            build = getattr(args_schema, 'model_json_schema', None) or getattr(args_schema, 'schema', None)
+            if build is None:
+                return None
+            try:
+                schema = build()
+            except Exception as e:
+                logger.debug(f"Failed to get schema for tool {tool_obj.name}: {e}")
+                return None
+
+        if cacheable:
+            _SCHEMA_CACHE[args_schema] = schema
+        return schema
+
+    def _invalidate_caches(self):
+        """工具集合变化后清除汇总缓存（描述文本、统计信息、名称列表）"""
+        self._description_cache = None
+        self._stats_view = None
+        self._tool_names = None
 
     # 工具管理方法
     def add_tool(self, tool: BaseTool) -> bool:
         """添加工具"""
         try:
-            if not isinstance(tool, BaseTool):
-                raise ValueError(f"Tool must be an instance of BaseTool, got {type(tool)}")
-
-            self.tools[tool.name] = tool
-            logger.info(f"Added tool: {tool.name}")
+            # 结构检查（鸭子类型）：有工具名和可调用的ainvoke即可，在任何运行模式下都执行
+            if not isinstance(getattr(tool, "name", None), str) or not callable(getattr(tool, "ainvoke", None)):
+                raise ValueError(f"Tool must be a BaseTool-like object with name and ainvoke, got {type(tool)}")
+
+            self._store_tool(tool)
+            self._invalidate_caches()
+            # 逐个注册时只记录调试日志，参数在级别过滤后才格式化
+            logger.debug("Added tool: {}", tool.name)
             return True
         except Exception as e:
             logger.error(f"Failed to add tool: {e}")
             return False
 
+    def _add_tools_bulk(self, tools: List[BaseTool]) -> int:
+        """批量添加工具：逐个写入存储，最后统一清除一次汇总缓存，不逐个记录日志"""
+        added = 0
+        for tool in tools:
+            try:
+                self._store_tool(tool)
+                added += 1
+            except Exception as e:
+                logger.error(f"Failed to add tool: {e}")
+
+        self._invalidate_caches()
+        logger.debug("Added {} tools", added)
+        return added
+
+    def _store_tool(self, tool: BaseTool) -> None:
+        """写入工具及其派生数据（不清除缓存、不记录日志）"""
+        name = sys.intern(tool.name)
+        self.tools[name] = tool
+        # 参数Schema和描述片段在注册时生成一次，覆盖同名工具时保持原有顺序
+        self._schema_cache[name] = self._build_schema(tool)
+        self._tool_types[name] = type(tool).__name__
+        self._invokers[name] = self._resolve_invoker(tool)
+        self._tool_descriptions[name] = self._render_tool_description(name, tool)
+
+    @staticmethod
+    def _resolve_invoker(tool_obj: BaseTool) -> Tuple[Optional[Callable], bool, bool]:
+        """
+        确定工具的执行函数及调用约定
+
+        优先使用LangChain的异步接口ainvoke/arun（以参数字典调用），
+        否则退回同步的run（参数字典）或func（关键字参数），由线程池执行
+        """
+        for attr in ('ainvoke', 'arun'):
+            method = getattr(tool_obj, attr, None)
+            if method is not None:
+                return method, True, True
+        run = getattr(tool_obj, 'run', None)
+        if run is not None:
+            return run, True, False
+        # 对于Tool类型的工具
+        return getattr(tool_obj, 'func', None), False, False
+
     def add_function_as_tool(self, func: Callable, name: str = None,
                            description: str = None, args_schema: BaseModel = None) -> bool:
         """将普通函数转换为LangChain工具"""
@@ -308,21 +455,16 @@ class ToolService(ToolServiceInterface):
             tool_name = name or func.__name__
             tool_description = description or func.__doc__ or f"Tool: {tool_name}"
 
-            if args_schema:
-                # 使用StructuredTool.from_function创建复杂工具
-                tool_obj = StructuredTool.from_function(
-                    func=func,
-                    name=tool_name,
-                    description=tool_description,
-                    args_schema=args_schema
-                )
-            else:
-                # 使用简单的Tool包装
-                tool_obj = Tool(
-                    name=tool_name,
-                    description=tool_description,
-                    func=func
-                )
+            # 统一使用StructuredTool：参数模型在创建时生成一次（未提供args_schema时从函数签名推断），
+            # 调用时直接按模型校验参数；协程函数作为coroutine注册，无需同步包装
+            is_async = inspect.iscoroutinefunction(func)
+            tool_obj = StructuredTool.from_function(
+                func=None if is_async else func,
+                coroutine=func if is_async else None,
+                name=tool_name,
+                description=tool_description,
+                args_schema=args_schema
+            )
 
             return self.add_tool(tool_obj)
         except Exception as e:
@@ -348,6 +490,11 @@ class ToolService(ToolServiceInterface):
                 return False
 
             del self.tools[tool_name]
+            self._schema_cache.pop(tool_name, None)
+            self._tool_types.pop(tool_name, None)
+            self._invokers.pop(tool_name, None)
+            self._tool_descriptions.pop(tool_name, None)
+            self._invalidate_caches()
             logger.info(f"Removed tool: {tool_name}")
             return True
         except Exception as e:
@@ -357,6 +504,11 @@ class ToolService(ToolServiceInterface):
     def clear_tools(self):
         """清空所有工具"""
         self.tools.clear()
+        self._schema_cache.clear()
+        self._tool_types.clear()
+        self._invokers.clear()
+        self._tool_descriptions.clear()
+        self._invalidate_caches()
         logger.info("Cleared all tools")
 
     def get_openwebui_tools(self) -> Dict[str, Dict]:
@@ -377,12 +529,10 @@ class ToolService(ToolServiceInterface):
                     parameters=parameters
                 )
 
-                # 获取生成的LangChain工具并添加到服务中
-                langchain_tools = universal_adapter.get_langchain_tools()
-                for tool in langchain_tools:
-                    if tool.name == name:
-                        self.add_tool(tool)
-                        break
+                # 按名称取出生成的LangChain工具并添加到服务中
+                langchain_tool = universal_adapter.get_langchain_tool(name)
+                if langchain_tool is not None:
+                    self.add_tool(langchain_tool)
 
                 logger.info(f"Registered universal tool: {name}")
                 return True
@@ -394,10 +544,6 @@ class ToolService(ToolServiceInterface):
             logger.error(f"Failed to register universal tool {name}: {e}")
             return False
 
-    def list_tool_names(self) -> List[str]:
-        """列出所有工具名称"""
-        return list(self.tools.keys())
-
 
 # 全局工具服务实例
 _tool_service_instance: Optional[ToolService] = None
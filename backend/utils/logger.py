@@ -24,9 +24,9 @@ def setup_logger():
         colorize=True
     )
     
-    # 添加文件输出
+    # 添加文件输出：delay=True时直到第一条日志写入才创建目录和文件，
+    # 导入时不再产生磁盘I/O
     log_file = Path(config.LOG_FILE)
-    log_file.parent.mkdir(parents=True, exist_ok=True)
     
     logger.add(
         log_file,
@@ -35,7 +35,8 @@ def setup_logger():
         rotation="10 MB",
         retention="7 days",
         compression="zip",
-        encoding="utf-8"
+        encoding="utf-8",
+        delay=True
     )
     
     return logger
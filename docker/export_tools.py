@@ -44,20 +44,17 @@ async def main():
 
         # 导出工具
         print(f"\n导出工具到OpenWebUI格式...")
-        success = export_tools_to_openwebui()
+        exported_files = export_tools_to_openwebui()
 
-        if success:
+        if exported_files is not None:
             print("工具导出成功！")
             print(f"\n导出位置: docker/openwebui_tools/")
             print(f"导出数量: {len(tool_names)} 个工具")
             
-            # 显示导出的文件
-            export_dir = "openwebui_tools"
-            if os.path.exists(export_dir):
-                files = [f for f in os.listdir(export_dir) if f.endswith('.py')]
-                print(f"\n导出的文件:")
-                for file in files:
-                    print(f"   - {file}")
+            # 显示导出的文件（由导出器直接返回，无需再扫描目录）
+            print(f"\n导出的文件:")
+            for file_path in exported_files:
+                print(f"   - {os.path.basename(file_path)}")
 
             print(f"\n使用说明:")
             print(f"   1. 重启OpenWebUI服务")
@@ -4,10 +4,68 @@ Agent工具函数
 """
 
 from pydantic import BaseModel, Field
-import requests
+import httpx
 import json
+import re
 from typing import List, Dict, Any
 
+# 支持配置的模型和模式关键字
+SUPPORTED_MODELS = ("qwen2.5:7b", "qwen2.5:14b", "llama3.1:8b", "mistral:7b", "qwen3:8b")
+_MODEL_RE = re.compile("|".join(re.escape(model) for model in SUPPORTED_MODELS))
+_MODE_RE = re.compile(r"chain|langgraph|graph|agent")
+# (关键字, 模式)，靠前的优先；"agent"几乎出现在每条配置消息中，放在最后
+_MODE_PRIORITY = (("chain", "chain"), ("langgraph", "langgraph"), ("graph", "langgraph"), ("agent", "agent"))
+
+# 请求分发关键字：一次扫描找出消息中出现的全部指令，再按_DISPATCH_ORDER的优先级选择
+_DISPATCH_RE = re.compile(
+    r"(?P<modes>列出模式|list modes)|(?P<models>列出模型|list models)|(?P<config>配置)"
+    r"|(?P<status>状态|status)|(?P<recommend>推荐|recommend)"
+)
+_DISPATCH_ORDER = ("modes", "models", "config", "status", "recommend")
+# "配置"指令还需要消息中带有配置对象
+_CONFIG_TARGET_RE = re.compile(r"agent|模式")
+
+# 模型大小单位：(字节数, 单位)，从大到小匹配
+_SIZE_UNITS = ((1_000_000_000, "GB"), (1_000_000, "MB"), (1_000, "KB"))
+
+
+def _fmt_size(size: int) -> str:
+    """格式化字节数，保留一位小数（整数运算，截断而非四舍五入）"""
+    for unit_size, unit in _SIZE_UNITS:
+        if size >= unit_size:
+            tenths = size // (unit_size // 10)
+            return f"{tenths // 10}.{tenths % 10}{unit}"
+    return f"{size}B"
+
+
+# 帮助信息，所有Pipe实例共享
+_HELP_MESSAGE = """
+🎯 Agent工具使用指南
+
+**可用命令:**
+• "列出模式" - 查看所有Agent模式
+• "列出模型" - 查看所有Ollama模型  
+• "配置chain Agent使用qwen2.5:7b模型" - 配置Agent
+• "获取状态" - 查看当前配置
+• "获取推荐" - 查看推荐配置
+
+**Agent模式:**
+🔗 **Chain Agent** - 适合日常对话和简单任务
+🛠️ **Tool Agent** - 适合工具调用和复杂任务
+🕸️ **Graph Agent** - 适合复杂工作流和状态管理
+
+**配置示例:**
+- "配置chain Agent使用qwen2.5:7b模型"
+- "配置agent Agent使用qwen2.5:14b模型"
+- "配置langgraph Agent使用llama3.1:8b模型"
+
+**快速开始:**
+1. 输入"列出模式"查看可用Agent
+2. 输入"列出模型"查看可用模型
+3. 选择合适的组合进行配置
+4. 切换到相应的Agent模型开始对话！
+"""
+
 
 class Pipe:
     class Valves(BaseModel):
@@ -22,6 +80,15 @@ class Pipe:
 
     def __init__(self):
         self.valves = self.Valves()
+        # 共享的异步HTTP客户端，保持连接复用，请求不再阻塞事件循环
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=4)
+        )
+
+    async def aclose(self):
+        """关闭HTTP客户端"""
+        await self._client.aclose()
 
     def pipes(self) -> List[Dict]:
         """返回Agent工具模型"""
@@ -41,16 +108,21 @@ class Pipe:
                 return self.get_help_message()
 
             last_message = messages[-1].get("content", "").lower()
-            
-            if "列出模式" in last_message or "list modes" in last_message:
+
+            found = {match.lastgroup for match in _DISPATCH_RE.finditer(last_message)}
+            if "config" in found and not _CONFIG_TARGET_RE.search(last_message):
+                found.discard("config")
+            action = next((name for name in _DISPATCH_ORDER if name in found), None)
+
+            if action == "modes":
                 return await self.list_agent_modes()
-            elif "列出模型" in last_message or "list models" in last_message:
+            elif action == "models":
                 return await self.list_ollama_models()
-            elif "配置" in last_message and ("agent" in last_message or "模式" in last_message):
+            elif action == "config":
                 return await self.handle_config_request(last_message)
-            elif "状态" in last_message or "status" in last_message:
+            elif action == "status":
                 return await self.get_agent_status()
-            elif "推荐" in last_message or "recommend" in last_message:
+            elif action == "recommend":
                 return await self.get_recommendations()
             else:
                 return self.get_help_message()
@@ -61,19 +133,23 @@ class Pipe:
     async def list_agent_modes(self) -> str:
         """列出Agent模式"""
         try:
-            response = requests.get(f"{self.valves.BACKEND_URL}/v1/agent/modes", timeout=10)
+            response = await self._client.get(f"{self.valves.BACKEND_URL}/v1/agent/modes")
             if response.status_code == 200:
                 data = response.json()
                 modes = data.get("modes", {})
                 
-                result = "🤖 可用的Agent模式:\n\n"
+                parts = ["🤖 可用的Agent模式:\n\n"]
                 for mode_id, mode_info in modes.items():
-                    result += f"**{mode_info['name']}** ({mode_id})\n"
-                    result += f"描述: {mode_info['description']}\n"
-                    result += f"特性: {', '.join(mode_info['features'])}\n"
-                    result += f"适用场景: {', '.join(mode_info['use_cases'])}\n\n"
+                    features = ", ".join(mode_info['features'])
+                    use_cases = ", ".join(mode_info['use_cases'])
+                    parts.append(
+                        f"**{mode_info['name']}** ({mode_id})\n"
+                        f"描述: {mode_info['description']}\n"
+                        f"特性: {features}\n"
+                        f"适用场景: {use_cases}\n\n"
+                    )
                 
-                return result
+                return "".join(parts)
             else:
                 return f"❌ 获取Agent模式失败: {response.status_code}"
         except Exception as e:
@@ -82,19 +158,19 @@ class Pipe:
     async def list_ollama_models(self) -> str:
         """列出Ollama模型"""
         try:
-            response = requests.get(f"{self.valves.OLLAMA_URL}/api/tags", timeout=10)
+            response = await self._client.get(f"{self.valves.OLLAMA_URL}/api/tags")
             if response.status_code == 200:
                 data = response.json()
                 models = data.get("models", [])
                 
-                result = "🧠 可用的Ollama模型:\n\n"
+                parts = ["🧠 可用的Ollama模型:\n\n"]
                 for model in models:
                     name = model.get("name", "")
                     size = model.get("size", 0)
-                    size_gb = f"{size / 1000000000:.1f}GB" if size > 0 else "未知大小"
-                    result += f"• **{name}** ({size_gb})\n"
+                    size_text = _fmt_size(size) if size > 0 else "未知大小"
+                    parts.append(f"• **{name}** ({size_text})\n")
                 
-                return result
+                return "".join(parts)
             else:
                 return f"❌ 获取模型列表失败: {response.status_code}"
         except Exception as e:
@@ -102,28 +178,15 @@ class Pipe:
 
     async def handle_config_request(self, message: str) -> str:
         """处理配置请求"""
-        # 简单的配置解析
-        if "chain" in message:
-            mode = "chain"
-        elif "agent" in message:
-            mode = "agent"
-        elif "langgraph" in message or "graph" in message:
-            mode = "langgraph"
-        else:
+        # 简单的配置解析：一次扫描找出消息中出现的模式关键字，再按优先级选择
+        found = set(_MODE_RE.findall(message))
+        mode = next((mode for keyword, mode in _MODE_PRIORITY if keyword in found), None)
+        if mode is None:
             return "❌ 请指定Agent模式 (chain, agent, langgraph)"
         
         # 提取模型名称
-        model = None
-        if "qwen2.5:7b" in message:
-            model = "qwen2.5:7b"
-        elif "qwen2.5:14b" in message:
-            model = "qwen2.5:14b"
-        elif "llama3.1:8b" in message:
-            model = "llama3.1:8b"
-        elif "mistral:7b" in message:
-            model = "mistral:7b"
-        elif "qwen3:8b" in message:
-            model = "qwen3:8b"
+        match = _MODEL_RE.search(message)
+        model = match.group(0) if match else None
         
         if not model:
             return f"❌ 请指定模型名称，例如: 配置{mode} Agent使用qwen2.5:7b模型"
@@ -138,10 +201,10 @@ class Pipe:
                 "model": model
             }
             
-            response = requests.post(
+            response = await self._client.post(
                 f"{self.valves.BACKEND_URL}/v1/agent/configure",
                 json=payload,
-                timeout=30
+                timeout=30.0
             )
             
             if response.status_code == 200:
@@ -159,19 +222,19 @@ class Pipe:
     async def get_agent_status(self) -> str:
         """获取Agent状态"""
         try:
-            response = requests.get(f"{self.valves.BACKEND_URL}/v1/agent/current-config", timeout=10)
+            response = await self._client.get(f"{self.valves.BACKEND_URL}/v1/agent/current-config")
             if response.status_code == 200:
                 data = response.json()
                 config = data.get("current_config", {})
                 
-                result = "⚙️ 当前Agent配置:\n\n"
+                parts = ["⚙️ 当前Agent配置:\n\n"]
                 for agent_type, agent_config in config.items():
                     mode = agent_config.get("mode", "")
                     model = agent_config.get("model", "")
                     status = agent_config.get("status", "")
-                    result += f"**{agent_type}**: {mode} + {model} ({status})\n"
+                    parts.append(f"**{agent_type}**: {mode} + {model} ({status})\n")
                 
-                return result
+                return "".join(parts)
             else:
                 return f"❌ 获取状态失败: {response.status_code}"
         except Exception as e:
@@ -180,23 +243,23 @@ class Pipe:
     async def get_recommendations(self) -> str:
         """获取推荐配置"""
         try:
-            response = requests.get(f"{self.valves.BACKEND_URL}/v1/agent/recommendations", timeout=10)
+            response = await self._client.get(f"{self.valves.BACKEND_URL}/v1/agent/recommendations")
             if response.status_code == 200:
                 data = response.json()
                 recommendations = data.get("recommendations", {})
                 
-                result = "💡 推荐配置:\n\n"
+                parts = ["💡 推荐配置:\n\n"]
                 
                 # 任务推荐
                 by_task = recommendations.get("by_task", {})
-                result += "**按任务类型推荐:**\n"
+                parts.append("**按任务类型推荐:**\n")
                 for task, rec in by_task.items():
                     mode = rec.get("recommended_mode", "")
                     model = rec.get("recommended_model", "")
                     reason = rec.get("reason", "")
-                    result += f"• {task}: {mode} + {model}\n  原因: {reason}\n\n"
+                    parts.append(f"• {task}: {mode} + {model}\n  原因: {reason}\n\n")
                 
-                return result
+                return "".join(parts)
             else:
                 return f"❌ 获取推荐失败: {response.status_code}"
         except Exception as e:
@@ -204,29 +267,4 @@ class Pipe:
 
     def get_help_message(self) -> str:
         """获取帮助信息"""
-        return """
-🎯 Agent工具使用指南
-
-**可用命令:**
-• "列出模式" - 查看所有Agent模式
-• "列出模型" - 查看所有Ollama模型  
-• "配置chain Agent使用qwen2.5:7b模型" - 配置Agent
-• "获取状态" - 查看当前配置
-• "获取推荐" - 查看推荐配置
-
-**Agent模式:**
-🔗 **Chain Agent** - 适合日常对话和简单任务
-🛠️ **Tool Agent** - 适合工具调用和复杂任务
-🕸️ **Graph Agent** - 适合复杂工作流和状态管理
-
-**配置示例:**
-- "配置chain Agent使用qwen2.5:7b模型"
-- "配置agent Agent使用qwen2.5:14b模型"
-- "配置langgraph Agent使用llama3.1:8b模型"
-
-**快速开始:**
-1. 输入"列出模式"查看可用Agent
-2. 输入"列出模型"查看可用模型
-3. 选择合适的组合进行配置
-4. 切换到相应的Agent模型开始对话！
-"""
+        return _HELP_MESSAGE
@@ -4,9 +4,115 @@ LangChain Agent Pipe for OpenWebUI
 """
 
 from pydantic import BaseModel, Field
-import requests
+from collections import OrderedDict
+import hashlib
+import httpx
+import importlib.util
 import json
-from typing import List, Dict, Any
+import logging
+import re
+import time
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+# 可选：安装h2后启用HTTP/2，多个并发请求复用同一连接；
+# httpx只在TLS连接上协商HTTP/2，BACKEND_URL/OLLAMA_URL为http://时仍使用HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 回复缓存最多保留的条目数
+RESPONSE_CACHE_SIZE = 256
+
+# 模型大小显示文本在模型字典中的键，获取模型列表时计算一次
+_SIZE_TEXT_KEY = "_size_gb"
+
+
+def _with_size_text(models: List[Dict]) -> List[Dict]:
+    """为每个模型写入格式化后的大小文本（未知大小为空字符串）"""
+    for model in models:
+        size = model.get("size") or 0
+        model[_SIZE_TEXT_KEY] = f"{size / 1000000000:.1f}GB" if size > 0 else ""
+    return models
+
+
+# Ollama不可用时的默认模型列表
+_DEFAULT_MODELS = _with_size_text([
+    {"name": "qwen2.5:7b", "size": 4000000000},
+    {"name": "qwen2.5:14b", "size": 8000000000},
+    {"name": "llama3.1:8b", "size": 5000000000},
+    {"name": "mistral:7b", "size": 4000000000}
+])
+
+# 模型ID格式：langchain-<Agent模式>-<Ollama模型名（":"替换为"-"）>
+_MODEL_ID_RE = re.compile(r"langchain-(chain|agent|langgraph)-(.+)")
+
+# 配置器命令关键字，一次扫描找出消息中出现的全部关键字；"mode"不匹配"model"的前缀
+_CONFIG_KEYWORD_RE = re.compile(
+    r"(?P<list>列出|list)|(?P<modes>模式|modes?(?!l))|(?P<models>模型|models?)|(?P<config>配置|config)"
+)
+
+# Agent模式定义，进程内共享的只读映射
+_AGENT_MODES: Mapping[str, Any] = MappingProxyType({
+    "chain": {
+        "name": "Chain Agent",
+        "description": "基于Runnable接口的简单Agent，适合日常对话",
+        "icon": "🔗",
+        "features": ("快速响应", "简单对话", "基础工具调用")
+    },
+    "agent": {
+        "name": "Tool Agent", 
+        "description": "支持工具调用的智能Agent，适合复杂任务",
+        "icon": "🛠️",
+        "features": ("工具调用", "推理能力", "多步骤任务")
+    },
+    "langgraph": {
+        "name": "Graph Agent",
+        "description": "基于状态图的高级Agent，适合复杂工作流",
+        "icon": "🕸️",
+        "features": ("状态管理", "复杂工作流", "条件分支")
+    }
+})
+
+# 配置说明和帮助信息
+_CONFIG_INSTRUCTIONS = """
+🔧 Agent配置说明:
+
+**自动配置方式:**
+直接选择想要的Agent模式和模型组合，系统会自动配置。
+
+**可用组合:**
+- 🔗 Chain Agent + 任意Ollama模型
+- 🛠️ Tool Agent + 任意Ollama模型  
+- 🕸️ Graph Agent + 任意Ollama模型
+
+**推荐配置:**
+- 日常对话: Chain Agent + qwen2.5:7b
+- 复杂任务: Tool Agent + qwen2.5:14b
+- 工作流: Graph Agent + llama3.1:8b
+
+选择模型后，系统会自动配置相应的Agent模式！
+"""
+
+_CONFIG_HELP = """
+🎯 LangChain Agent配置器
+
+**可用命令:**
+- "列出模式" - 查看所有Agent模式
+- "列出模型" - 查看所有Ollama模型
+- "配置说明" - 查看配置方法
+- "帮助" - 显示此帮助信息
+
+**快速开始:**
+1. 从模型列表中选择Agent模式和模型组合
+2. 系统自动配置相应的Agent
+3. 开始对话！
+
+**Agent模式:**
+🔗 Chain Agent - 简单对话
+🛠️ Tool Agent - 工具调用
+🕸️ Graph Agent - 复杂工作流
+"""
 
 
 class Pipe:
@@ -27,83 +133,103 @@ class Pipe:
             default=True,
             description="在模型名称中显示详细信息"
         )
+        CACHE_TTL_SECONDS: int = Field(
+            default=300,
+            description="Ollama模型列表缓存时间（秒），0表示不缓存"
+        )
+        RESPONSE_CACHE_ENABLED: bool = Field(
+            default=False,
+            description="缓存temperature为0的非流式请求的回复，相同对话直接返回"
+        )
 
     def __init__(self):
         self.valves = self.Valves()
-        self.agent_modes = {
-            "chain": {
-                "name": "Chain Agent",
-                "description": "基于Runnable接口的简单Agent，适合日常对话",
-                "icon": "🔗",
-                "features": ["快速响应", "简单对话", "基础工具调用"]
-            },
-            "agent": {
-                "name": "Tool Agent", 
-                "description": "支持工具调用的智能Agent，适合复杂任务",
-                "icon": "🛠️",
-                "features": ["工具调用", "推理能力", "多步骤任务"]
-            },
-            "langgraph": {
-                "name": "Graph Agent",
-                "description": "基于状态图的高级Agent，适合复杂工作流",
-                "icon": "🕸️",
-                "features": ["状态管理", "复杂工作流", "条件分支"]
-            }
-        }
+        # 共享的异步HTTP客户端：复用到后端和Ollama的长连接，请求不阻塞事件循环
+        # 传入transport时客户端不再使用自身的http2/limits参数，需在transport上设置
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=20),
+                retries=2
+            )
+        )
+        # Ollama模型列表缓存：(Ollama地址, 获取时间, 模型列表)
+        self._models_cache = ("", 0.0, [])
+        # pipes()结果缓存，模型清单和显示设置不变时直接复用
+        self._pipes_key = None
+        self._pipes_value: List[Dict] = []
+        # 模型ID后缀 -> Ollama模型名，由pipes()填充
+        self._model_raw_to_name: Dict[str, str] = {}
+        # 回复缓存：请求摘要 -> 回复内容，按LRU淘汰
+        self._resp_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self.agent_modes = _AGENT_MODES
+
+    async def aclose(self):
+        """关闭HTTP客户端"""
+        await self._client.aclose()
+
+    async def get_ollama_models(self) -> List[Dict]:
+        """获取Ollama可用模型（按CACHE_TTL_SECONDS缓存，Ollama地址变化时重新获取），附带大小文本"""
+        ollama_url = self.valves.OLLAMA_URL
+        cached_url, fetched_at, cached_models = self._models_cache
+        if cached_url == ollama_url and time.monotonic() - fetched_at < self.valves.CACHE_TTL_SECONDS:
+            return cached_models
 
-    def get_ollama_models(self) -> List[Dict]:
-        """获取Ollama可用模型"""
         try:
-            response = requests.get(f"{self.valves.OLLAMA_URL}/api/tags", timeout=10)
+            response = await self._client.get(f"{ollama_url}/api/tags")
             if response.status_code == 200:
                 data = response.json()
-                return data.get("models", [])
+                models = _with_size_text(data.get("models", []))
+                self._models_cache = (ollama_url, time.monotonic(), models)
+                return models
         except Exception as e:
-            print(f"Failed to get Ollama models: {e}")
+            logger.warning("Failed to get Ollama models: %s", e)
         
         # 返回默认模型列表
-        return [
-            {"name": "qwen2.5:7b", "size": 4000000000},
-            {"name": "qwen2.5:14b", "size": 8000000000},
-            {"name": "llama3.1:8b", "size": 5000000000},
-            {"name": "mistral:7b", "size": 4000000000}
-        ]
+        return _DEFAULT_MODELS
 
-    def pipes(self) -> List[Dict]:
+    async def pipes(self) -> List[Dict]:
         """返回可用的模型列表（Agent模式 + 模型组合）"""
         if not self.valves.ENABLE_AGENT_MODES:
             return []
 
+        ollama_models = await self.get_ollama_models()
+        show_model_info = self.valves.SHOW_MODEL_INFO
+        key = (tuple((m.get("name", ""), m.get("size", 0)) for m in ollama_models), show_model_info)
+        if key == self._pipes_key:
+            return self._pipes_value
+
+        # 每个模型的ID后缀只计算一次，大小文本已在获取模型列表时写入
+        model_entries = [
+            (name, name.replace(':', '-'), m[_SIZE_TEXT_KEY])
+            for (name, _), m in zip(key[0], ollama_models)
+        ]
+        self._model_raw_to_name.update((id_suffix, name) for name, id_suffix, _ in model_entries)
+
         models = []
-        ollama_models = self.get_ollama_models()
-        
         # 为每个Agent模式创建模型选项
         for mode_id, mode_info in self.agent_modes.items():
-            for ollama_model in ollama_models:
-                model_name = ollama_model.get("name", "")
-                model_size = ollama_model.get("size", 0)
-                
-                # 计算模型大小
-                size_gb = f"{model_size / 1000000000:.1f}GB" if model_size > 0 else ""
-                
-                # 构建模型ID和显示名称
-                model_id = f"langchain-{mode_id}-{model_name.replace(':', '-')}"
-                
-                if self.valves.SHOW_MODEL_INFO:
-                    display_name = f"{mode_info['icon']} {mode_info['name']} + {model_name}"
+            icon = mode_info['icon']
+            mode_name = mode_info['name']
+            mode_description = mode_info['description']
+            features = mode_info["features"]
+            for model_name, id_suffix, size_gb in model_entries:
+                if show_model_info:
+                    display_name = f"{icon} {mode_name} + {model_name}"
                     if size_gb:
                         display_name += f" ({size_gb})"
                 else:
-                    display_name = f"{mode_info['name']} ({model_name})"
+                    display_name = f"{mode_name} ({model_name})"
                 
                 models.append({
-                    "id": model_id,
+                    "id": f"langchain-{mode_id}-{id_suffix}",
                     "name": display_name,
-                    "description": f"{mode_info['description']} - 使用 {model_name} 模型",
+                    "description": f"{mode_description} - 使用 {model_name} 模型",
                     "metadata": {
                         "agent_mode": mode_id,
                         "ollama_model": model_name,
-                        "features": mode_info["features"]
+                        "features": features
                     }
                 })
         
@@ -118,6 +244,8 @@ class Pipe:
             }
         })
         
+        self._pipes_key = key
+        self._pipes_value = models
         return models
 
     async def pipe(self, body: dict, __user__: dict = None) -> str:
@@ -134,29 +262,45 @@ class Pipe:
                 return "错误：无效的模型ID"
             
             # 提取Agent模式和Ollama模型
-            parts = model_id.replace("langchain-", "").split("-", 1)
-            if len(parts) < 2:
+            match = _MODEL_ID_RE.fullmatch(model_id)
+            if match is None:
                 return "错误：无法解析模型ID"
             
-            agent_mode = parts[0]
-            ollama_model = parts[1].replace("-", ":")
-            
-            # 配置Agent
-            await self.configure_agent(agent_mode, ollama_model)
+            agent_mode, raw_model = match.groups()
+            ollama_model = self._model_raw_to_name.get(raw_model)
+            if ollama_model is None:
+                # 未在模型列表中出现过的ID：最后一个"-"还原为标签分隔符":"
+                name, _, tag = raw_model.rpartition("-")
+                ollama_model = f"{name}:{tag}" if name else raw_model
             
-            # 转发请求到LangChain后端
+            # 转发请求到LangChain后端，Agent配置随请求一起发送，后端仅在模型变化时切换
             backend_model = f"langchain-{agent_mode}-mode"
-            payload = {**body, "model": backend_model}
+            payload = {
+                **body,
+                "model": backend_model,
+                "agent_config": {"mode": agent_mode, "model": ollama_model}
+            }
+            
+            cache_key = self._response_cache_key(body, backend_model, ollama_model, messages)
+            if cache_key is not None:
+                cached = self._resp_cache.get(cache_key)
+                if cached is not None:
+                    self._resp_cache.move_to_end(cache_key)
+                    return cached
             
-            response = requests.post(
+            response = await self._client.post(
                 f"{self.valves.BACKEND_URL}/v1/chat/completions",
                 json=payload,
-                timeout=60
+                timeout=60.0
             )
             
             if response.status_code == 200:
                 data = response.json()
                 content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                if cache_key is not None:
+                    self._resp_cache[cache_key] = content
+                    if len(self._resp_cache) > RESPONSE_CACHE_SIZE:
+                        self._resp_cache.popitem(last=False)
                 return content
             else:
                 return f"错误：后端请求失败 ({response.status_code})"
@@ -164,6 +308,15 @@ class Pipe:
         except Exception as e:
             return f"错误：{str(e)}"
 
+    def _response_cache_key(self, body: dict, backend_model: str, ollama_model: str, messages: List[Dict]):
+        """计算回复缓存键；未启用缓存、流式请求或temperature不为0时返回None"""
+        if not self.valves.RESPONSE_CACHE_ENABLED or body.get("stream"):
+            return None
+        if body.get("temperature", 0.7) != 0:
+            return None
+        raw = json.dumps([backend_model, ollama_model, messages], ensure_ascii=False, sort_keys=True)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
     async def configure_agent(self, mode: str, model: str):
         """配置Agent模式和模型"""
         try:
@@ -172,19 +325,20 @@ class Pipe:
                 "model": model
             }
             
-            response = requests.post(
+            response = await self._client.post(
                 f"{self.valves.BACKEND_URL}/v1/agent/configure",
                 json=payload,
-                timeout=30
+                timeout=30.0
             )
             
             if response.status_code == 200:
-                print(f"Successfully configured {mode} agent with {model} model")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Configured %s agent with %s model", mode, model)
             else:
-                print(f"Failed to configure agent: {response.status_code}")
+                logger.warning("Failed to configure agent: %s", response.status_code)
                 
         except Exception as e:
-            print(f"Error configuring agent: {e}")
+            logger.error("Error configuring agent: %s", e)
 
     async def handle_config_request(self, messages: List[Dict]) -> str:
         """处理配置请求"""
@@ -192,80 +346,46 @@ class Pipe:
             return self.get_config_help()
         
         last_message = messages[-1].get("content", "").lower()
+        found = {match.lastgroup for match in _CONFIG_KEYWORD_RE.finditer(last_message)}
         
-        if "列出" in last_message or "list" in last_message:
-            if "模式" in last_message or "mode" in last_message:
+        if "list" in found:
+            if "modes" in found:
                 return self.list_agent_modes()
-            elif "模型" in last_message or "model" in last_message:
-                return self.list_ollama_models()
+            elif "models" in found:
+                return await self.list_ollama_models()
         
-        elif "配置" in last_message or "config" in last_message:
+        elif "config" in found:
             return self.get_config_instructions()
         
-        elif "帮助" in last_message or "help" in last_message:
-            return self.get_config_help()
-        
+        # 帮助命令及无法识别的命令都返回帮助信息
         return self.get_config_help()
 
     def list_agent_modes(self) -> str:
         """列出Agent模式"""
-        result = "🤖 可用的Agent模式:\n\n"
+        parts = ["🤖 可用的Agent模式:\n\n"]
         for mode_id, mode_info in self.agent_modes.items():
-            result += f"**{mode_info['icon']} {mode_info['name']}** ({mode_id})\n"
-            result += f"描述: {mode_info['description']}\n"
-            result += f"特性: {', '.join(mode_info['features'])}\n\n"
-        return result
+            features = ", ".join(mode_info['features'])
+            parts.append(
+                f"**{mode_info['icon']} {mode_info['name']}** ({mode_id})\n"
+                f"描述: {mode_info['description']}\n"
+                f"特性: {features}\n\n"
+            )
+        return "".join(parts)
 
-    def list_ollama_models(self) -> str:
+    async def list_ollama_models(self) -> str:
         """列出Ollama模型"""
-        models = self.get_ollama_models()
-        result = "🧠 可用的Ollama模型:\n\n"
+        models = await self.get_ollama_models()
+        parts = ["🧠 可用的Ollama模型:\n\n"]
         for model in models:
             name = model.get("name", "")
-            size = model.get("size", 0)
-            size_gb = f"{size / 1000000000:.1f}GB" if size > 0 else "未知大小"
-            result += f"• **{name}** ({size_gb})\n"
-        return result
+            size_gb = model[_SIZE_TEXT_KEY] or "未知大小"
+            parts.append(f"• **{name}** ({size_gb})\n")
+        return "".join(parts)
 
     def get_config_instructions(self) -> str:
         """获取配置说明"""
-        return """
-🔧 Agent配置说明:
-
-**自动配置方式:**
-直接选择想要的Agent模式和模型组合，系统会自动配置。
-
-**可用组合:**
-- 🔗 Chain Agent + 任意Ollama模型
-- 🛠️ Tool Agent + 任意Ollama模型  
-- 🕸️ Graph Agent + 任意Ollama模型
-
-**推荐配置:**
-- 日常对话: Chain Agent + qwen2.5:7b
-- 复杂任务: Tool Agent + qwen2.5:14b
-- 工作流: Graph Agent + llama3.1:8b
-
-选择模型后，系统会自动配置相应的Agent模式！
-"""
+        return _CONFIG_INSTRUCTIONS
 
     def get_config_help(self) -> str:
         """获取帮助信息"""
-        return """
-🎯 LangChain Agent配置器
-
-**可用命令:**
-- "列出模式" - 查看所有Agent模式
-- "列出模型" - 查看所有Ollama模型
-- "配置说明" - 查看配置方法
-- "帮助" - 显示此帮助信息
-
-**快速开始:**
-1. 从模型列表中选择Agent模式和模型组合
-2. 系统自动配置相应的Agent
-3. 开始对话！
-
-**Agent模式:**
-🔗 Chain Agent - 简单对话
-🛠️ Tool Agent - 工具调用
-🕸️ Graph Agent - 复杂工作流
-"""
+        return _CONFIG_HELP
@@ -20,25 +20,6 @@ OpenWebUI工具索引
 - calculate: 计算数学表达式，支持基本的四则运算、幂运算和取模运算
 """
 
-# 工具列表
-AVAILABLE_TOOLS = [
-    "calculator",
-    "get_current_time",
-    "format_timestamp",
-    "web_search",
-    "wikipedia_search",
-    "string_processor",
-    "list_processor",
-    "read_file",
-    "write_file",
-    "list_files",
-    "extract_information",
-    "generate_uuid",
-    "date_calculator",
-    "weather_query",
-    "calculate"
-]
-
 # 工具描述
 TOOL_DESCRIPTIONS = {
     "calculator": "计算数学表达式，支持基本的四则运算、幂运算和取模运算",
@@ -57,3 +38,11 @@ TOOL_DESCRIPTIONS = {
     "weather_query": "查询指定地点的天气信息",
     "calculate": "计算数学表达式，支持基本的四则运算、幂运算和取模运算",
 }
+
+# 工具列表（由TOOL_DESCRIPTIONS派生）
+AVAILABLE_TOOLS = tuple(TOOL_DESCRIPTIONS)
+
+
+def has_tool(name: str) -> bool:
+    """检查工具是否存在"""
+    return name in TOOL_DESCRIPTIONS
@@ -4,8 +4,94 @@ Agent配置工具
 """
 
 import json
+import time
 import requests
-from typing import Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Tuple
+
+# 模块级HTTP会话：复用到后端的长连接，避免每次调用重新握手；
+# 网关类临时错误（502/503/504）自动重试，重试耗尽后仍返回原响应
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False
+    )
+))
+
+# (连接超时, 读取超时)：后端不可达时快速失败，读取按操作耗时区分
+QUERY_TIMEOUT = (3, 10)
+CONFIGURE_TIMEOUT = (3, 30)
+CHAT_TIMEOUT = (3, 60)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _post_json(url: str, payload: Dict[str, Any], timeout, stream: bool = False):
+    """发送JSON请求，orjson可用时直接发送序列化后的字节"""
+    if ORJSON_AVAILABLE:
+        return _SESSION.post(url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=timeout, stream=stream)
+    return _SESSION.post(url, json=payload, timeout=timeout, stream=stream)
+
+
+def _parse_json(response) -> Any:
+    """解析JSON响应，orjson可用时直接解析响应字节"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _read_chat_preview(response, limit: int) -> str:
+    """
+    读取聊天回复的前limit个字符
+
+    流式（SSE）响应在读够后立即关闭连接，不再接收剩余内容；
+    后端返回普通JSON时按完整回复截取
+    """
+    try:
+        if not response.headers.get("content-type", "").startswith("text/event-stream"):
+            data = _parse_json(response)
+            return data.get("choices", [{}])[0].get("message", {}).get("content", "")[:limit]
+
+        parts = []
+        length = 0
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            chunk = line[5:].strip()
+            if chunk == b"[DONE]":
+                break
+            data = orjson.loads(chunk) if ORJSON_AVAILABLE else json.loads(chunk)
+            delta = data.get("choices", [{}])[0].get("delta", {}).get("content") or ""
+            parts.append(delta)
+            length += len(delta)
+            if length >= limit:
+                break
+        return "".join(parts)[:limit]
+    finally:
+        response.close()
+
+
+# test_chat展示的回复长度
+TEST_CHAT_PREVIEW_CHARS = 200
+
+# 模式和模型列表的结果缓存：操作 -> (获取时间, 结果文本)，配置成功后清空；
+# 当前配置可能被其他入口修改，不缓存
+CACHE_TTL_SECONDS = 300
+_CACHEABLE_ACTIONS = frozenset({"list_modes", "list_models"})
+_CACHE: Dict[str, Tuple[float, str]] = {}
 
 
 def agent_configurator(
@@ -24,15 +110,32 @@ def agent_configurator(
     Returns:
         配置结果或信息
     """
-    
+    cacheable = action in _CACHEABLE_ACTIONS
+    if cacheable:
+        cached = _CACHE.get(action)
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+
+    result = _run_action(action, mode, model)
+
+    if cacheable and not result.startswith("❌"):
+        _CACHE[action] = (time.monotonic(), result)
+    elif action == "configure" and result.startswith("✅"):
+        # 配置成功后重新获取列表
+        _CACHE.clear()
+    return result
+
+
+def _run_action(action: str, mode: str, model: str) -> str:
+    """执行配置操作（不经过缓存）"""
     base_url = "http://langchain-backend:8000"
     
     try:
         if action == "list_modes":
             # 列出可用的Agent模式
-            response = requests.get(f"{base_url}/v1/agent/modes", timeout=10)
+            response = _SESSION.get(f"{base_url}/v1/agent/modes", timeout=QUERY_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 modes = data.get("modes", {})
                 
                 result = "🤖 可用的Agent模式:\n\n"
@@ -48,9 +151,9 @@ def agent_configurator(
         
         elif action == "list_models":
             # 列出可用的模型
-            response = requests.get(f"{base_url}/api/tags", timeout=10)
+            response = _SESSION.get(f"{base_url}/api/tags", timeout=QUERY_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 models = data.get("models", [])
                 
                 result = "🧠 可用的模型:\n\n"
@@ -74,14 +177,10 @@ def agent_configurator(
                 "model": model
             }
             
-            response = requests.post(
-                f"{base_url}/v1/agent/configure",
-                json=payload,
-                timeout=30
-            )
+            response = _post_json(f"{base_url}/v1/agent/configure", payload, timeout=CONFIGURE_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data.get("success"):
                     return f"✅ 配置成功！{mode} Agent 现在使用 {model} 模型"
                 else:
@@ -91,9 +190,9 @@ def agent_configurator(
         
         elif action == "get_current":
             # 获取当前配置
-            response = requests.get(f"{base_url}/v1/agent/current-config", timeout=10)
+            response = _SESSION.get(f"{base_url}/v1/agent/current-config", timeout=QUERY_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 config = data.get("current_config", {})
                 
                 result = "⚙️ 当前Agent配置:\n\n"
@@ -121,28 +220,24 @@ def agent_configurator(
                         "content": "你好，请介绍一下你当前的配置和能力"
                     }
                 ],
-                "stream": False,
+                "stream": True,
                 "temperature": 0.7
             }
             
-            response = requests.post(
-                f"{base_url}/v1/chat/completions",
-                json=payload,
-                timeout=60
-            )
+            response = _post_json(f"{base_url}/v1/chat/completions", payload, timeout=CHAT_TIMEOUT, stream=True)
             
             if response.status_code == 200:
-                data = response.json()
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                return f"💬 {mode} Agent 测试成功!\n\n回复: {content[:200]}..."
+                content = _read_chat_preview(response, TEST_CHAT_PREVIEW_CHARS)
+                return f"💬 {mode} Agent 测试成功!\n\n回复: {content}..."
             else:
+                response.close()
                 return f"❌ 测试对话失败: {response.status_code}"
         
         elif action == "recommendations":
             # 获取推荐配置
-            response = requests.get(f"{base_url}/v1/agent/recommendations", timeout=10)
+            response = _SESSION.get(f"{base_url}/v1/agent/recommendations", timeout=QUERY_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 recommendations = data.get("recommendations", {})
                 
                 result = "💡 推荐配置:\n\n"
@@ -175,36 +270,39 @@ def agent_configurator(
         return f"❌ 操作失败: {str(e)}"
 
 
-# OpenWebUI工具定义
-def get_tools():
-    """返回OpenWebUI格式的工具定义"""
-    return [
-        {
-            "name": "agent_configurator",
-            "description": "配置和管理LangChain Agent模式和模型",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "description": "操作类型",
-                        "enum": ["list_modes", "list_models", "configure", "get_current", "test_chat", "recommendations"]
-                    },
-                    "mode": {
-                        "type": "string",
-                        "description": "Agent模式 (chain, agent, langgraph)",
-                        "enum": ["chain", "agent", "langgraph"]
-                    },
-                    "model": {
-                        "type": "string",
-                        "description": "模型名称 (如 qwen2.5:7b)"
-                    }
+# OpenWebUI工具定义，在模块加载时创建一次
+TOOLS_DEF = [
+    {
+        "name": "agent_configurator",
+        "description": "配置和管理LangChain Agent模式和模型",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "description": "操作类型",
+                    "enum": ["list_modes", "list_models", "configure", "get_current", "test_chat", "recommendations"]
                 },
-                "required": ["action"]
+                "mode": {
+                    "type": "string",
+                    "description": "Agent模式 (chain, agent, langgraph)",
+                    "enum": ["chain", "agent", "langgraph"]
+                },
+                "model": {
+                    "type": "string",
+                    "description": "模型名称 (如 qwen2.5:7b)"
+                }
             },
-            "function": agent_configurator
-        }
-    ]
+            "required": ["action"]
+        },
+        "function": agent_configurator
+    }
+]
+
+
+def get_tools():
+    """返回OpenWebUI格式的工具定义"""
+    return TOOLS_DEF
 
 
 if __name__ == "__main__":
@@ -5,41 +5,138 @@ OpenWebUI工具: extract_information
 自动生成的工具文件 - 请勿手动修改
 """
 
+from collections import OrderedDict
 from typing import Any, Dict
-import json
+import asyncio
+import os
+import time
+import httpx
+
+# OpenWebUI将每个工具文件单独保存并执行，工具文件之间无法导入共享模块，
+# 以下辅助代码由导出器生成到每个工具文件中，请保持精简
+
+_BACKEND_URL = "http://langchain-backend:8000"
+_EXECUTE_URL = f"{_BACKEND_URL}/v1/tools/execute"
+
+# 模块级异步HTTP客户端：复用到后端的长连接，多个工具调用可在同一事件循环中并发执行
+_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    transport=httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        retries=2
+    )
+)
+
+# 工具结果缓存：参数 -> (过期时间, 结果)，按LRU淘汰；CACHE_TTL_SECONDS为0表示不缓存
+CACHE_TTL_SECONDS = 0
+CACHE_MAX_ENTRIES = 1024
+_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+
+# 与LangChain后端同进程部署时直接调用本地工具，省去HTTP往返
+try:
+    from backend.tools.adapters.universal_tool_adapter import universal_adapter as _local_adapter
+except ImportError:
+    _local_adapter = None
+
+
+async def _execute_tool(tool_name: str, parameters: Dict[str, Any]) -> str:
+    """执行工具：依次尝试结果缓存、本地调用和LangChain后端API"""
+    try:
+        cache_key = repr(tuple(parameters.values()))
+        entry = _CACHE.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            _CACHE.move_to_end(cache_key)
+            return entry[1]
+
+        local_tool = _local_adapter.get_langchain_tool(tool_name) if _local_adapter is not None else None
+        if local_tool is not None:
+            result = str(await local_tool.arun(parameters))
+        else:
+            payload = {"tool_name": tool_name, "parameters": parameters}
+            response = await _CLIENT.post(_EXECUTE_URL, json=payload)
+            if response.status_code != 200:
+                return f"工具执行失败: {response.status_code}"
+            # 后端原样返回工具结果，可能是字典或列表，统一转为文本
+            result = str(response.json().get("result", "执行成功"))
+
+        # 失败提示不缓存
+        if CACHE_TTL_SECONDS > 0 and not result.startswith("❌"):
+            _CACHE[cache_key] = (time.monotonic() + CACHE_TTL_SECONDS, result)
+            _CACHE.move_to_end(cache_key)
+            if len(_CACHE) > CACHE_MAX_ENTRIES:
+                _CACHE.popitem(last=False)
+        return result
+
+    except Exception as e:
+        return f"工具执行错误: {str(e)}"
+
+
+async def _prewarm():
+    """请求后端健康检查接口，使到后端的连接提前进入连接池"""
+    try:
+        await _CLIENT.get(f"{_BACKEND_URL}/health", timeout=2)
+    except Exception:
+        pass
+
+
+# 在加载工具的事件循环上后台预热连接，首次调用无需等待DNS解析和TCP握手；
+# 同进程部署、没有运行中的事件循环或设置了NO_PREWARM时跳过
+_PREWARM_TASK = None
+if _local_adapter is None and not os.environ.get("NO_PREWARM"):
+    try:
+        _PREWARM_TASK = asyncio.get_running_loop().create_task(_prewarm())
+    except RuntimeError:
+        pass
 
 
 class Tools:
+    __slots__ = ("citation",)
+
     def __init__(self):
-        self.citation = true
+        self.citation = True
 
-    def extract_information(self, text: str, info_type: str = "emails") -> str:
+    async def extract_information(self, text: str, info_type: str = "emails") -> str:
         """
         从文本中提取特定信息，如邮箱、网址、电话号码等
         
         :param text: 要分析的文本
         :param info_type: 信息类型
         """
-        try:
-            # 调用LangChain后端API
-            import requests
-            
-            url = "http://langchain-backend:8000/v1/tools/execute"
-            payload = {
-                "tool_name": "extract_information",
-                "parameters": {"text": text, "info_type": info_type}
-            }
-            
-            response = requests.post(url, json=payload, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("result", "执行成功")
-            else:
-                return f"工具执行失败: {response.status_code}"
-                
-        except Exception as e:
-            return f"工具执行错误: {str(e)}"
+        return await _execute_tool("extract_information", {"text": text, "info_type": info_type})
+
+
+# 工具实例和定义在模块加载时创建一次
+_TOOLS = Tools()
+TOOLS_DEF = {
+    "extract_information": {
+        "callable": _TOOLS.extract_information,
+        "citation": _TOOLS.citation,
+        "description": "从文本中提取特定信息，如邮箱、网址、电话号码等",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "要分析的文本"
+                },
+                "info_type": {
+                    "type": "string",
+                    "description": "信息类型",
+                    "enum": [
+                        "emails",
+                        "urls",
+                        "phones",
+                        "numbers"
+                    ],
+                    "default": "emails"
+                }
+            },
+            "required": [
+                "text"
+            ]
+        }
+    }
+}
 
 
 # OpenWebUI工具规范
@@ -47,42 +144,14 @@ class Extract_InformationTool:
     """
     OpenWebUI extract_information 工具
     """
+    __slots__ = ("tools",)
     
     def __init__(self):
-        self.tools = Tools()
+        self.tools = _TOOLS
     
     def get_tools(self):
         """返回工具定义"""
-        return {
-            "extract_information": {
-                "callable": self.tools.extract_information,
-                "citation": self.tools.citation,
-                "description": "从文本中提取特定信息，如邮箱、网址、电话号码等",
-                "parameters": {
-                "type": "object",
-                "properties": {
-                                "text": {
-                                                "type": "string",
-                                                "description": "要分析的文本"
-                                },
-                                "info_type": {
-                                                "type": "string",
-                                                "description": "信息类型",
-                                                "enum": [
-                                                                "emails",
-                                                                "urls",
-                                                                "phones",
-                                                                "numbers"
-                                                ],
-                                                "default": "emails"
-                                }
-                },
-                "required": [
-                                "text"
-                ]
-}
-            }
-        }
+        return TOOLS_DEF
 
 
 # 实例化工具
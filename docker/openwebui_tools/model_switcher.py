@@ -3,16 +3,54 @@ OpenWebUI工具: 模型切换器
 在OpenWebUI界面中提供Agent模型切换功能
 """
 
-from typing import Any, Dict, List
-import json
-import requests
+import asyncio
+import os
+import httpx
+
+# 模块级异步HTTP客户端：复用到后端的长连接，多个工具调用可在同一事件循环中并发执行
+_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    transport=httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        retries=2
+    )
+)
+
+
+async def _prewarm():
+    """请求后端健康检查接口，使到后端的连接提前进入连接池"""
+    try:
+        await _CLIENT.get("http://langchain-backend:8000/health", timeout=2)
+    except Exception:
+        pass
+
+
+def _schedule_prewarm():
+    """
+    在加载工具的事件循环上后台预热连接，首次工具调用无需等待DNS解析和TCP握手
+
+    没有运行中的事件循环或设置了NO_PREWARM时跳过
+    """
+    if os.environ.get("NO_PREWARM"):
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return loop.create_task(_prewarm())
+
+
+# 保留任务引用，避免预热完成前被回收
+_PREWARM_TASK = _schedule_prewarm()
 
 
 class Tools:
+    __slots__ = ("citation",)
+
     def __init__(self):
         self.citation = True
 
-    def switch_agent_model(self, agent_type: str, new_model: str) -> str:
+    async def switch_agent_model(self, agent_type: str, new_model: str) -> str:
         """
         切换Agent的底层模型
         
@@ -24,7 +62,7 @@ class Tools:
             url = f"http://langchain-backend:8000/v1/models/{agent_type}/switch"
             payload = {"model": new_model}
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = await _CLIENT.post(url, json=payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -38,14 +76,14 @@ class Tools:
         except Exception as e:
             return f"❌ 切换异常: {str(e)}"
 
-    def get_agent_models_info(self) -> str:
+    async def get_agent_models_info(self) -> str:
         """
         获取所有Agent的模型信息
         """
         try:
             # 调用配置API
             url = "http://langchain-backend:8000/v1/models/config"
-            response = requests.get(url, timeout=10)
+            response = await _CLIENT.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -70,14 +108,14 @@ class Tools:
         except Exception as e:
             return f"❌ 获取信息异常: {str(e)}"
 
-    def list_available_tools(self) -> str:
+    async def list_available_tools(self) -> str:
         """
         列出所有可用的工具
         """
         try:
             # 调用工具配置API
             url = "http://langchain-backend:8000/v1/tools/config"
-            response = requests.get(url, timeout=10)
+            response = await _CLIENT.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -112,57 +150,83 @@ class Tools:
         except Exception as e:
             return f"❌ 获取工具异常: {str(e)}"
 
+    async def get_overview(self) -> str:
+        """
+        获取Agent模型信息和可用工具列表（两个请求并发执行）
+        """
+        models_info, tools_list = await asyncio.gather(
+            self.get_agent_models_info(),
+            self.list_available_tools()
+        )
+        return f"{models_info}\n{tools_list}"
+
+
+# 工具实例和定义在模块加载时创建一次
+_TOOLS = Tools()
+TOOLS_DEF = {
+    "switch_agent_model": {
+        "callable": _TOOLS.switch_agent_model,
+        "description": "切换Agent的底层模型",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "agent_type": {
+                    "type": "string",
+                    "enum": ["chain", "agent", "langgraph"],
+                    "description": "Agent类型"
+                },
+                "new_model": {
+                    "type": "string", 
+                    "enum": ["qwen2.5:7b", "qwen2.5:14b", "llama3.1:8b", "mistral:7b"],
+                    "description": "新的模型名称"
+                }
+            },
+            "required": ["agent_type", "new_model"]
+        }
+    },
+    "get_agent_models_info": {
+        "callable": _TOOLS.get_agent_models_info,
+        "description": "获取所有Agent的模型信息",
+        "parameters": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "list_available_tools": {
+        "callable": _TOOLS.list_available_tools,
+        "description": "列出所有可用的工具",
+        "parameters": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "get_overview": {
+        "callable": _TOOLS.get_overview,
+        "description": "一次获取所有Agent的模型信息和可用工具列表，优先于分别调用上面两个工具",
+        "parameters": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    }
+}
+
 
 # OpenWebUI工具规范
 class ModelSwitcherTool:
     """
     OpenWebUI模型切换工具
     """
+    __slots__ = ("tools",)
     
     def __init__(self):
-        self.tools = Tools()
+        self.tools = _TOOLS
     
     def get_tools(self):
-        return {
-            "switch_agent_model": {
-                "callable": self.tools.switch_agent_model,
-                "description": "切换Agent的底层模型",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "agent_type": {
-                            "type": "string",
-                            "enum": ["chain", "agent", "langgraph"],
-                            "description": "Agent类型"
-                        },
-                        "new_model": {
-                            "type": "string", 
-                            "enum": ["qwen2.5:7b", "qwen2.5:14b", "llama3.1:8b", "mistral:7b"],
-                            "description": "新的模型名称"
-                        }
-                    },
-                    "required": ["agent_type", "new_model"]
-                }
-            },
-            "get_agent_models_info": {
-                "callable": self.tools.get_agent_models_info,
-                "description": "获取所有Agent的模型信息",
-                "parameters": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            "list_available_tools": {
-                "callable": self.tools.list_available_tools,
-                "description": "列出所有可用的工具",
-                "parameters": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            }
-        }
+        """返回工具定义"""
+        return TOOLS_DEF
 
 
 # 导出工具实例
@@ -10,7 +10,6 @@ Gradio前端界面
 5. 工具调用展示
 """
 
-import asyncio
 import sys
 import os
 from pathlib import Path
@@ -97,15 +96,11 @@ class GradioInterface:
             history.append((message, f"❌ 系统错误: {str(e)}"))
             return history, ""
     
-    def clear_chat(self) -> Tuple[List, str]:
+    async def clear_chat(self) -> Tuple[List, str]:
         """清除聊天记录"""
         if self.current_session_id and self.initialized:
             try:
-                # 异步清除会话（在同步函数中）
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.api.clear_memory(self.current_session_id))
-                loop.close()
+                await self.api.clear_memory(self.current_session_id)
             except:
                 pass
         
@@ -149,29 +144,11 @@ def create_gradio_app():
     """创建Gradio应用"""
     
     # 初始化函数
+    # Gradio直接支持异步事件处理函数，所有调用共用Gradio的事件循环，
+    # 不再为每次请求新建并关闭事件循环
     async def init_system():
         return await interface.initialize()
     
-    # 聊天函数（同步包装）
-    def chat_wrapper(message, history):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(interface.chat(message, history))
-            return result
-        finally:
-            loop.close()
-    
-    # 初始化函数（同步包装）
-    def init_wrapper():
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(init_system())
-            return result
-        finally:
-            loop.close()
-    
     # 创建Gradio界面
     with gr.Blocks(
         title="LangChain Agent 聊天界面",
@@ -242,8 +219,8 @@ def create_gradio_app():
         # 事件绑定
         
         # 发送消息
-        def submit_message(message, history):
-            return chat_wrapper(message, history)
+        async def submit_message(message, history):
+            return await interface.chat(message, history)
         
         send_btn.click(
             submit_message,
@@ -265,7 +242,7 @@ def create_gradio_app():
         
         # 初始化系统
         init_btn.click(
-            init_wrapper,
+            init_system,
             outputs=[status_display]
         )
         
@@ -18,6 +18,12 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+# 可选：使用基于libuv的uvloop事件循环（Windows不支持）
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 def start_gradio():
     """启动Gradio Web界面"""
@@ -245,6 +251,8 @@ def main():
         elif actual_mode == "openwebui":
             start_openwebui()
         elif actual_mode == "backend":
+            if uvloop is not None:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
             asyncio.run(start_backend())
         else:
             show_help()
@@ -0,0 +1,39 @@
+"""
+MCP工具加载器测试：重新加载后API工具必须使用新的HTTP客户端，
+不能保留持有已关闭客户端的旧工具
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("loguru")
+httpx = pytest.importorskip("httpx")
+
+from backend.config import config
+from backend.tools.mcp.mcp_loader import MCPToolLoader
+
+
+def test_api_tool_works_after_reloads(monkeypatch):
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text="pong"))
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs))
+    monkeypatch.setattr(config, "MCP_TOOLS_CONFIG", {
+        "enabled": True,
+        "servers": {"api": {"type": "api", "base_url": "http://mcp.test"}},
+    })
+    loader = MCPToolLoader()
+
+    async def scenario():
+        await loader.load_mcp_tools()
+        await loader.load_mcp_tools()
+        tools = await loader.load_mcp_tools()
+        try:
+            assert [tool.name for tool in tools] == ["call_api_mcp"]
+            assert loader.mcp_servers == {"api": {"type": "api", "tools": 1}}
+            return await tools[0].ainvoke({"endpoint": "/ping"})
+        finally:
+            await loader.close()
+
+    assert asyncio.run(scenario()) == "API响应: pong"
@@ -0,0 +1,53 @@
+"""
+OpenWebUI工具导出器测试：导出的参数定义必须是Python字面量（True/False/None），
+不能是JSON的true/false/null，否则生成的工具文件在导入时触发NameError
+"""
+
+import ast
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("loguru")
+
+from backend.tools.adapters.openwebui_exporter import OpenWebUIExporter, _to_python_literal
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": "查询内容"},
+        "strict": {"type": "boolean", "description": "严格匹配", "default": False},
+        "verbose": {"type": "boolean", "description": "详细输出", "default": True},
+        "limit": {"type": "integer", "description": "结果数量", "default": None},
+        "tags": {"type": "array", "items": {"type": "string"}, "default": []},
+    },
+    "required": ["query"],
+}
+
+
+def test_schema_round_trips_as_python_literal():
+    rendered = _to_python_literal(SCHEMA)
+
+    assert ast.literal_eval(rendered) == SCHEMA
+    for json_token in ("true", "false", "null"):
+        assert json_token not in rendered.split()
+
+
+def test_generated_tool_file_compiles_with_literal_schema(tmp_path):
+    exporter = OpenWebUIExporter(str(tmp_path))
+    content = exporter._generate_tool_file_content(
+        "sample_tool", {"description": "示例工具", "parameters": SCHEMA, "citation": True}
+    )
+
+    tree = ast.parse(content, filename="sample_tool.py")
+    compile(tree, "sample_tool.py", "exec")
+
+    # TOOLS_DEF中"parameters"对应的值必须能按字面量还原为原始定义
+    schemas = [
+        ast.literal_eval(value)
+        for node in ast.walk(tree) if isinstance(node, ast.Dict)
+        for key, value in zip(node.keys, node.values)
+        if isinstance(key, ast.Constant) and key.value == "parameters" and isinstance(value, ast.Dict)
+    ]
+    assert schemas == [SCHEMA]